@@ -10,6 +10,8 @@
 import bpy, random
 from typing import cast
 
+from .data_util_funcs import *
+
 # ------------------------
 
 # -------------------------------------------------------
@@ -31,49 +33,6 @@ def is_blender_4_1():
 
 # --------------------------------------------
 
-# ------------------------------
-# DATA CONVERSIONS / INVERSIONS
-# ------------------------------
-
-# UV Map inverter for import and export purposes.
-def invert_uv_map(uv_set: tuple[float, float]) -> tuple[float, float]:
-    """Invert the V component of a UV Map."""
-    return (uv_set[0], 1 - uv_set[1])
-
-# Reverse an n-point vector's values. Used for flipping faces' indices ordering.
-def reverse_vector(vector: list | tuple) -> tuple:
-    """Reverse an n-point vector's values."""
-    return tuple(reversed(vector))
-
-# Take the XYZ of a mesh's normals (or tangents) and divide them by 127. (Their maximum range)
-def convert_vertex_normal(nx: int, ny: int, nz: int) -> tuple[float, float, float]:
-    """Takes the XYZ of the normals and divides them by 127 to convert them from signed bytes to floats so Blender can parse them."""
-    nx_conv = nx / 127
-    ny_conv = ny / 127
-    nz_conv = nz / 127
-
-    return (nx_conv, ny_conv, nz_conv)
-
-# Take the RGBA values of a mesh's vertex colors and divide them by 255.
-def convert_vertex_color(r: int, g: int, b: int, a: int) -> list[float, float, float, float]:
-    """Takes the RGBA of the vertex colors and divides them by 255 to convert them from signed bytes to floats so Blender can parse them."""
-    r_conv = r / 255
-    g_conv = g / 255
-    b_conv = b / 255
-    a_conv = a / 255
-
-    return [r_conv, g_conv, b_conv, a_conv]
-
-# Converter for single color channels from Linear to sRGB Color Space.
-def linear_to_srgb(value: float) -> float:
-    """Convert a single color channel from Linear to sRGB Color Space."""
-    if value <= 0.0031308:
-        return value * 12.92
-    else:
-        return 1.055 * pow(value, 1.0 / 2.4) - 0.055
-
-# -------------------------------------------------------------------------------------------------------------------------------------------------
-
 # ----------
 # MATERIALS
 # ----------
@@ -0,0 +1,207 @@
+# ------------------------------------------------
+#   BINARY GLTF EXPORTER
+#       Writes parsed Forge meshes out as .glb
+#       files without needing Blender
+# ------------------------------------------------
+"""
+Writes parsed Forge meshes out as binary glTF (`.glb`) files without needing Blender.
+
+Can be run on its own to convert a whole folder of meshes:
+
+    python -m io_scene_forge.gltf_exporter [--weights] <input folder> [output folder]
+"""
+
+import os
+import sys
+import json
+import contextlib
+import time
+import struct
+import numpy as np
+
+from .model_parser import ForgeMesh
+
+# -------------------------------------------------------
+# GLTF CONSTANTS
+# -------------------------------------------------------
+
+GLB_MAGIC = 0x46546C67         # "glTF"
+GLB_VERSION = 2
+GLB_CHUNK_JSON = 0x4E4F534A    # "JSON"
+GLB_CHUNK_BIN = 0x004E4942     # "BIN\0"
+
+COMPONENT_UNSIGNED_BYTE = 5121
+COMPONENT_UNSIGNED_SHORT = 5123
+COMPONENT_UNSIGNED_INT = 5125
+COMPONENT_FLOAT = 5126
+
+# Component types of the face indices, by their size in bytes
+INDEX_COMPONENT_TYPES = {
+    1: COMPONENT_UNSIGNED_BYTE,
+    2: COMPONENT_UNSIGNED_SHORT,
+    4: COMPONENT_UNSIGNED_INT,
+}
+
+TARGET_ARRAY_BUFFER = 34962
+TARGET_ELEMENT_ARRAY_BUFFER = 34963
+
+# Align a byte offset to the next 4 byte boundary, as glTF requires for buffer views and chunks.
+def align4(offset: int) -> int:
+    """Round a byte offset up to the next multiple of 4."""
+    return (offset + 3) & ~3
+
+# -------------------------------------------------------------------------------------------------------------------------------------------------
+
+# Write a parsed mesh to a .glb file.
+def write_glb(model: ForgeMesh, out_path: str, include_weights: bool = False) -> int:
+    """Write the first mesh of a parsed `ForgeMesh` to a binary glTF file. Returns the number of bytes written.
+    Bone weights are only written when `include_weights` is set, since there's no skin for them to point at."""
+    mesh_data = model.mesh_data[0]
+
+    vertex_records: np.ndarray = mesh_data["vertex_records"]
+    faces: np.ndarray = mesh_data["faces"]
+    if len(vertex_records) == 0 or len(faces) == 0:
+        raise ValueError(f"Mesh has no geometry to export! ({model.model_file})")
+
+    # Everything that ends up in the BIN chunk, as (buffer view, raw bytes)
+    views: list[dict] = []
+    blobs: list[memoryview] = []
+    bin_length = 0
+
+    def add_view(data: np.ndarray, target: int, stride: int = 0) -> int:
+        nonlocal bin_length
+        view = {"buffer": 0, "byteOffset": bin_length, "byteLength": data.nbytes, "target": target}
+        if stride:
+            view["byteStride"] = stride
+        views.append(view)
+        blobs.append(memoryview(np.ascontiguousarray(data)).cast("B"))
+        bin_length = align4(bin_length + data.nbytes)
+        return len(views) - 1
+
+    # The vertex records are already little endian, so they go in as-is as one interleaved view.
+    # glTF wants vertex strides in multiples of 4 though, which undocumented vertex types might not be.
+    vertex_layout = vertex_records.dtype
+    if vertex_layout.itemsize % 4 == 0:
+        vertex_view = add_view(vertex_records, TARGET_ARRAY_BUFFER, vertex_layout.itemsize)
+        position_offset = vertex_layout.fields["position"][1]
+    else:
+        vertex_view = add_view(mesh_data["vertices"], TARGET_ARRAY_BUFFER)
+        position_offset = 0
+    index_view = add_view(faces.astype(faces.dtype.newbyteorder("<"), copy=False), TARGET_ELEMENT_ARRAY_BUFFER)
+
+    vertex_count = len(vertex_records)
+    positions = mesh_data["vertices"]
+    accessors = [
+        {"bufferView": vertex_view, "byteOffset": position_offset, "componentType": COMPONENT_FLOAT, "count": vertex_count, "type": "VEC3",
+         "min": positions.min(axis=0).tolist(), "max": positions.max(axis=0).tolist()},
+        {"bufferView": index_view, "componentType": INDEX_COMPONENT_TYPES[faces.dtype.itemsize], "count": faces.size, "type": "SCALAR"},
+    ]
+    attributes = {"POSITION": 0}
+    index_accessor = 1
+
+    # Undocumented vertex types might not have any UVs we know about.
+    # glTF has its UV origin at the top left like the file does, so these come straight from the records rather than the
+    # flipped maps made for Blender. There's no half float TEXCOORD either, so they get widened to floats.
+    for (attribute, uv_field) in (("TEXCOORD_0", "uv_primary"), ("TEXCOORD_1", "uv_secondary")):
+        if uv_field in vertex_layout.names:
+            uvs = vertex_records[uv_field].astype(np.float32)
+            attributes[attribute] = len(accessors)
+            accessors.append({"bufferView": add_view(uvs, TARGET_ARRAY_BUFFER), "componentType": COMPONENT_FLOAT, "count": vertex_count, "type": "VEC2"})
+
+    # UnskinnedCompressed vertices carry their bone weights in the same records.
+    # Without a skeleton there's no skin to go with them, which glTF validators flag, so they're opt-in.
+    if include_weights and "bone_weights" in vertex_layout.names:
+        attributes["WEIGHTS_0"] = len(accessors)
+        accessors.append({"bufferView": vertex_view, "byteOffset": vertex_layout.fields["bone_weights"][1], "componentType": COMPONENT_UNSIGNED_SHORT,
+                          "normalized": True, "count": vertex_count, "type": "VEC4"})
+        attributes["JOINTS_0"] = len(accessors)
+        accessors.append({"bufferView": vertex_view, "byteOffset": vertex_layout.fields["bone_indices"][1], "componentType": COMPONENT_UNSIGNED_BYTE,
+                          "count": vertex_count, "type": "VEC4"})
+
+    mesh_name = os.path.splitext(os.path.basename(model.model_file))[0]
+    gltf = {
+        "asset": {"version": "2.0", "generator": "io_scene_forge"},
+        "scene": 0,
+        "scenes": [{"nodes": [0]}],
+        "nodes": [{"name": mesh_name, "mesh": 0}],
+        "meshes": [{"name": mesh_name, "primitives": [{"attributes": attributes, "indices": index_accessor}]}],
+        "buffers": [{"byteLength": bin_length}],
+        "bufferViews": views,
+        "accessors": accessors,
+    }
+
+    json_chunk = json.dumps(gltf, separators=(",", ":")).encode()
+    json_chunk += b" " * (align4(len(json_chunk)) - len(json_chunk))
+
+    # Lay the whole BIN chunk out in one buffer so it goes to disk in a single write
+    total_length = 12 + 8 + len(json_chunk) + 8 + bin_length
+    glb = bytearray(total_length)
+    struct.pack_into("<III", glb, 0, GLB_MAGIC, GLB_VERSION, total_length)
+    struct.pack_into("<II", glb, 12, len(json_chunk), GLB_CHUNK_JSON)
+    glb[20:20 + len(json_chunk)] = json_chunk
+
+    bin_start = 20 + len(json_chunk)
+    struct.pack_into("<II", glb, bin_start, bin_length, GLB_CHUNK_BIN)
+    bin_start += 8
+    for (view, blob) in zip(views, blobs):
+        offset = bin_start + view["byteOffset"]
+        glb[offset:offset + len(blob)] = blob
+
+    with open(out_path, "wb") as out_file:
+        out_file.write(glb)
+
+    return total_length
+
+# -------------------------------------------------------------------------------------------------------------------------------------------------
+
+# Convert a whole folder of meshes.
+def export_directory(input_dir: str, output_dir: str, include_weights: bool = False) -> None:
+    """Convert every `.forgemesh` file in `input_dir` to a `.glb` file in `output_dir`, reporting throughput as it goes."""
+    os.makedirs(output_dir, exist_ok=True)
+
+    converted = 0
+    failed = 0
+    bytes_in = 0
+    bytes_out = 0
+    start_time = time.perf_counter()
+
+    with open(os.devnull, "w") as quiet_output:
+        for entry in sorted(os.scandir(input_dir), key=lambda entry: entry.name):
+            if not entry.is_file() or not entry.name.lower().endswith(".forgemesh"):
+                continue
+
+            out_path = os.path.join(output_dir, os.path.splitext(entry.name)[0] + ".glb")
+            try:
+                # The parser logs its whole header; keep that out of the console (and out of the timings) in batch mode
+                with contextlib.redirect_stdout(quiet_output):
+                    model = ForgeMesh(entry.path)
+                bytes_out += write_glb(model, out_path, include_weights)
+            except (OSError, ValueError, struct.error) as error:
+                # Broken, unreadable or unwritable; move on to the next mesh
+                print(f"Skipping {entry.name}: {error}")
+                failed += 1
+                continue
+
+            converted += 1
+            bytes_in += entry.stat().st_size
+
+    elapsed = max(time.perf_counter() - start_time, 1e-9)
+    print(f"\nConverted {converted} meshes ({failed} skipped) in {elapsed:.2f}s")
+    print(f"  {converted / elapsed:.1f} meshes/s, {bytes_in / elapsed / (1024 * 1024):.1f} MB/s read, {bytes_out / elapsed / (1024 * 1024):.1f} MB/s written")
+
+# Command line entry point.
+def main(argv: list[str]) -> int:
+    """Command line entry point. Usage: `gltf_exporter [--weights] <input folder> [output folder]`"""
+    include_weights = "--weights" in argv
+    argv = [arg for arg in argv if arg != "--weights"]
+    if len(argv) not in (1, 2):
+        print("Usage: python -m io_scene_forge.gltf_exporter [--weights] <input folder> [output folder]")
+        return 1
+
+    input_dir = argv[0]
+    output_dir = argv[1] if len(argv) == 2 else input_dir
+    export_directory(input_dir, output_dir, include_weights)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,71 @@
+# ------------------------------------------------
+#   LOD BUILDER
+#       Builds reduced detail versions of meshes
+#       by clustering their vertices on a grid
+# ------------------------------------------------
+"""
+Builds reduced detail versions of meshes by clustering their vertices on a grid. Works on plain NumPy arrays, no Blender needed.
+"""
+
+import numpy as np
+
+# How many times the grid size gets refined to get closer to the target vertex count.
+GRID_REFINE_STEPS = 4
+
+# Snap every vertex to a grid and merge the ones sharing a cell.
+def cluster_vertices(positions: np.ndarray, resolution: int) -> tuple[np.ndarray, np.ndarray]:
+    """Snap `positions` to a `resolution`^3 grid over their bounding box. Returns each vertex's cluster index and the number of clusters."""
+    low = positions.min(axis=0)
+    size = np.maximum(positions.max(axis=0) - low, 1e-8)
+
+    cells = np.minimum(((positions - low) / size * resolution).astype(np.int64), resolution - 1)
+    keys = (cells[:, 0] * resolution + cells[:, 1]) * resolution + cells[:, 2]
+
+    _, cluster_of_vertex = np.unique(keys, return_inverse=True)
+    cluster_of_vertex = cluster_of_vertex.ravel()
+    return cluster_of_vertex, int(cluster_of_vertex.max()) + 1
+
+# Build the reduced mesh.
+def build_lod(positions: np.ndarray, faces: np.ndarray, target_ratio: float) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Reduce a triangle mesh to roughly `target_ratio` of its vertices by grid based vertex clustering.
+    Returns the new `(positions, faces, source vertices)`, where the source vertices are an original vertex for each new one to copy UVs and such from."""
+    vertex_count = len(positions)
+    if vertex_count == 0 or len(faces) == 0 or target_ratio >= 1:
+        return np.asarray(positions, dtype=np.float32), np.asarray(faces, dtype=np.int32), np.arange(vertex_count, dtype=np.int32)
+
+    target_count = max(int(vertex_count * target_ratio), 4)
+
+    # Meshes are surfaces, so the number of occupied cells grows with the square of the grid resolution.
+    # Start from a guess and nudge the resolution towards the target a few times.
+    resolution = max(int(np.sqrt(target_count)), 2)
+    for (_) in range(GRID_REFINE_STEPS):
+        cluster_of_vertex, cluster_count = cluster_vertices(positions, resolution)
+        if abs(cluster_count - target_count) <= target_count * 0.1:
+            break
+        resolution = max(int(resolution * np.sqrt(target_count / cluster_count)), 2)
+    else:
+        cluster_of_vertex, cluster_count = cluster_vertices(positions, resolution)
+
+    # Each cluster sits at the average of the vertices in it, and takes everything else from its first vertex
+    first_vertex = np.empty(cluster_count, dtype=np.int32)
+    first_vertex[cluster_of_vertex[::-1]] = np.arange(vertex_count - 1, -1, -1, dtype=np.int32)
+
+    counts = np.bincount(cluster_of_vertex, minlength=cluster_count).astype(np.float64)
+    lod_positions = np.empty((cluster_count, 3), dtype=np.float32)
+    for axis in range(3):
+        lod_positions[:, axis] = np.bincount(cluster_of_vertex, weights=positions[:, axis], minlength=cluster_count) / counts
+
+    # Remap the triangles, dropping the ones that collapsed and any duplicates
+    lod_faces = cluster_of_vertex[faces]
+    keep = (lod_faces[:, 0] != lod_faces[:, 1]) & (lod_faces[:, 1] != lod_faces[:, 2]) & (lod_faces[:, 0] != lod_faces[:, 2])
+    lod_faces = lod_faces[keep]
+
+    _, unique_faces = np.unique(np.sort(lod_faces, axis=1), axis=0, return_index=True)
+    lod_faces = lod_faces[np.sort(unique_faces)]
+
+    # Drop clusters that no triangle uses anymore
+    used = np.zeros(cluster_count, dtype=bool)
+    used[lod_faces] = True
+    remap = np.cumsum(used) - 1
+
+    return lod_positions[used], remap[lod_faces].astype(np.int32), first_vertex[used]
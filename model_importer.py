@@ -12,15 +12,17 @@ import bpy
 import math
 import os
 import struct
+import numpy as np
 
 from .model_parser import ForgeMesh
+from .lod_builder import build_lod
 from .bpy_util_funcs import *
 
 from itertools import chain
 from collections import defaultdict
 
 # Import the model!
-def import_model(file_path: str, use_custom_normals: bool = False, assign_material_colors: bool = True):
+def import_model(file_path: str, use_custom_normals: bool = False, assign_material_colors: bool = True, lod_ratio: float = 0.0, reload_on_change: bool = False):
     """Import a model and construct it in Blender."""
 
     print(f"\nIMPORTING MODEL: {file_path}...\n")
@@ -30,19 +32,24 @@ def import_model(file_path: str, use_custom_normals: bool = False, assign_materi
         print(f"Cannot import model; file not found at: {file_path}")
         return {'FINISHED'}
 
+    # Already imported this file? Update those objects (with the new settings) instead of piling up duplicates
+    existing_objects = get_model_objects(file_path)
+    if existing_objects:
+        for obj in existing_objects:
+            obj["forge_custom_normals"] = use_custom_normals
+            obj["forge_reload_on_change"] = reload_on_change
+            if 0 < lod_ratio < 1:
+                obj["forge_lod_ratio"] = lod_ratio
+            else:
+                remove_lod_proxy(obj)
+        reload_model(file_path, existing_objects, rebuild=True)
+        print("\nMODEL IMPORT COMPLETE!")
+        return {'FINISHED'}
+
     model = ForgeMesh(file_path, use_custom_normals, assign_material_colors)
     
     # Extract data from the parsers
-    model_data = {
-        "filepath": model.model_file,
-        "vertices": model.mesh_data[0]["vertices"],
-        "faces": model.mesh_data[0]["faces"],
-        # "normals": model.mesh_data[0]["normals"],
-        "uv1": model.mesh_data[0]["uv_map_1"],
-        "uv2": model.mesh_data[0]["uv_map_2"],
-        "bone_indices": model.mesh_data[0].get("bone_indices", []),
-        "bone_weights": model.mesh_data[0].get("bone_weights", []),
-    }
+    model_data = get_model_data(model)
 
     # Extract the filename for mesh naming
     filename = os.path.splitext(os.path.basename(file_path))[0]
@@ -50,7 +57,7 @@ def import_model(file_path: str, use_custom_normals: bool = False, assign_materi
     print(f"\nBuilding Mesh: {mesh_name}")
 
     # Create a new Blender mesh and object
-    mesh = bpy.data.meshes.new(name=mesh_name)
+    mesh = build_mesh(mesh_name, model_data, use_custom_normals)
     obj = bpy.data.objects.new(mesh_name, mesh)
     bpy.context.scene.collection.objects.link(obj)
 
@@ -58,28 +65,6 @@ def import_model(file_path: str, use_custom_normals: bool = False, assign_materi
     obj.rotation_euler[0] += math.radians(90)
     print("Rotating the model by 90 degrees upwards")
 
-    def add_weights(obj, bone_ids, bone_weights):
-        """Add vertex group weights to the object."""
-        print("Adding vertex weights...")
-        vertex_groups = {}
-
-        # Loop through vertices and assign weights
-        for vertex_index, (vertex_bone_ids, vertex_bone_weights) in enumerate(zip(bone_ids, bone_weights)):
-            for bone_index, weight in zip(vertex_bone_ids, vertex_bone_weights):
-                # Ignore zero weights
-                if weight == 0:
-                    continue
-
-                group_name = f"bone_{bone_index}"
-
-                # Create the vertex group if it doesn't exist
-                if group_name not in vertex_groups:
-                    vertex_groups[group_name] = obj.vertex_groups.new(name=group_name)
-
-                # Normalize weight
-                normalized_weight = weight / 65535.0
-                vertex_groups[group_name].add([vertex_index], normalized_weight, 'REPLACE')
-    
     def add_model_materials(obj):
         """Add materials to the model."""
         # This implementation is quite simple, It just adds a material on the model.
@@ -90,41 +75,316 @@ def import_model(file_path: str, use_custom_normals: bool = False, assign_materi
     
     add_model_materials(obj)
 
+    # Add weights
+    add_weights(obj, model_data["bone_indices"], model_data["bone_weights"])
+
+    # Remember where this came from so it can be reloaded when the file changes
+    remember_model_source(obj, file_path, use_custom_normals, reload_on_change)
+
+    # Show a reduced version of the model in the viewport, if wanted
+    if 0 < lod_ratio < 1:
+        attach_lod_proxy(obj, model_data, lod_ratio)
+
+    print("\nMODEL IMPORT COMPLETE!")
+    return {'FINISHED'}
+
+# Pull the data the importer needs out of a parsed model.
+def get_model_data(model: ForgeMesh) -> dict:
+    """Extract the data needed to build a Blender mesh from a parsed model."""
+    return {
+        "filepath": model.model_file,
+        "vertices": model.mesh_data[0]["vertices"],
+        "faces": model.mesh_data[0]["faces"],
+        "normals": model.mesh_data[0]["normals"],
+        "uv1": model.mesh_data[0]["uv_map_1"],
+        "uv2": model.mesh_data[0]["uv_map_2"],
+        "bone_indices": model.mesh_data[0].get("bone_indices", []),
+        "bone_weights": model.mesh_data[0].get("bone_weights", []),
+    }
+
+# Build a Blender mesh out of the model data.
+def build_mesh(mesh_name: str, model_data: dict, use_custom_normals: bool = False) -> bpy.types.Mesh:
+    """Create a new Blender mesh with the model's vertices, faces, normals and UV maps."""
+    mesh = bpy.data.meshes.new(name=mesh_name)
+
     # First build the mesh with vertices, faces and normals - Credit: REDxEYE for fixed/improved code with support for other Blender versions
-    # if use_custom_normals is False:
-    #     mesh.from_pydata(model_data["vertices"], [], model_data["faces"])
-    #     mesh.polygons.foreach_set("use_smooth", [True] * len(mesh.polygons))
-    #     if not is_blender_4_1():    # Blender 4.1 removed "use_auto_smooth" which was used on previous versions of the program.
-    #         mesh.use_auto_smooth = True
-    #     mesh.normals_split_custom_set_from_vertices(model_data["normals"])
-    #     print("  Parsed vertices and faces with normals from the model.")
-    # else:
     shade_flat = False
-    mesh.from_pydata(model_data["vertices"], [], model_data["faces"], shade_flat)
-    print("  Parsed vertices and faces with custom normals.")
-
-    # Add the UV map
-    uv_map_1 = model_data["uv1"]
-    uv_map_2 = model_data["uv2"]
-    if uv_map_1:
-        uv_layer = mesh.uv_layers.new(name="UV_01")
-        for loop in mesh.loops:
-            uv_layer.data[loop.index].uv = uv_map_2[loop.vertex_index]
+    mesh.from_pydata(model_data["vertices"], [], model_data["faces"].astype(np.int32), shade_flat)
+    if use_custom_normals is False and len(model_data["normals"]):
+        if not is_blender_4_1():    # Blender 4.1 removed "use_auto_smooth" which was used on previous versions of the program.
+            mesh.use_auto_smooth = True
+        mesh.normals_split_custom_set_from_vertices(model_data["normals"])
+        print("  Parsed vertices and faces with normals from the model.")
+    else:
+        print("  Parsed vertices and faces with custom normals.")
+
+    # Add the UV maps
+    if len(model_data["uv1"]):
+        mesh.uv_layers.new(name="UV_01")
         print("Added UV Map #1.")
-    if uv_map_2:
-        uv_layer = mesh.uv_layers.new(name="UV_02")
-        for loop in mesh.loops:
-            uv_layer.data[loop.index].uv = uv_map_2[loop.vertex_index]
+    if len(model_data["uv2"]):
+        mesh.uv_layers.new(name="UV_02")
         print("Added UV Map #2.")
+    set_uv_maps(mesh, model_data)
 
-    # Add weights
+    # Finalize the mesh. Tangents need a UV map, which small undocumented vertex types don't have
+    if mesh.uv_layers:
+        mesh.calc_tangents()
+    mesh.update()
+
+    return mesh
+
+# Fill the mesh's UV layers from the per-vertex UV maps.
+def set_uv_maps(mesh: bpy.types.Mesh, model_data: dict) -> None:
+    """Write the model's per-vertex UV maps into the mesh's `UV_01`/`UV_02` layers, all loops at once."""
+    loop_vertices = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", loop_vertices)
+
+    for (layer_name, uv_key) in (("UV_01", "uv1"), ("UV_02", "uv2")):
+        uv_layer = mesh.uv_layers.get(layer_name)
+        if uv_layer is not None and len(model_data[uv_key]):
+            uv_layer.data.foreach_set("uv", np.ascontiguousarray(model_data[uv_key][loop_vertices], dtype=np.float32).ravel())
+
+# Add vertex group weights to an object.
+def add_weights(obj: bpy.types.Object, bone_ids, bone_weights) -> None:
+    """Add vertex group weights to the object."""
+    print("Adding vertex weights...")
+    vertex_groups = {}
+
+    # Loop through vertices and assign weights
+    for vertex_index, (vertex_bone_ids, vertex_bone_weights) in enumerate(zip(bone_ids, bone_weights)):
+        for bone_index, weight in zip(vertex_bone_ids, vertex_bone_weights):
+            # Ignore zero weights
+            if weight == 0:
+                continue
+
+            group_name = f"bone_{bone_index}"
+
+            # Create the vertex group if it doesn't exist
+            if group_name not in vertex_groups:
+                vertex_groups[group_name] = obj.vertex_groups.new(name=group_name)
+
+            # Normalize weight
+            normalized_weight = weight / 65535.0
+            vertex_groups[group_name].add([vertex_index], normalized_weight, 'REPLACE')
+
+# -------------------------------------------------------------------------------------------------------------------------------------------------
+
+# -----------
+# LOD PROXIES
+# -----------
+
+# Give an object a reduced viewport stand-in.
+def attach_lod_proxy(obj: bpy.types.Object, model_data: dict, lod_ratio: float) -> bpy.types.Object | None:
+    """Build a reduced LOD of the model and attach it as a viewport-only child of `obj`. The full detail object is hidden in the viewport but still renders.
+    The proxy follows `obj` and can't be moved on its own, so the viewport and the render stay in line.
+    Skinned models don't get a proxy, since it couldn't follow the skeleton."""
+    if len(model_data["bone_weights"]):
+        print(f"Skipping the LOD proxy for '{obj.name}', skinned models need their full mesh to deform.")
+        remove_lod_proxy(obj)
+        return None
+
+    lod_positions, lod_faces, source_vertices = build_lod(model_data["vertices"], model_data["faces"], lod_ratio)
+
+    lod_mesh_name = f"{obj.data.name}_LOD"
+    lod_mesh = bpy.data.meshes.new(name=lod_mesh_name)
+    lod_mesh.from_pydata(lod_positions, [], lod_faces, False)
+    for material in obj.data.materials:
+        lod_mesh.materials.append(material)
+
+    # Carry the UVs over so textured shading still looks right
+    lod_uvs = {}
+    for (layer_name, uv_key) in (("UV_01", "uv1"), ("UV_02", "uv2")):
+        lod_uvs[uv_key] = model_data[uv_key][source_vertices] if len(model_data[uv_key]) else model_data[uv_key]
+        if len(lod_uvs[uv_key]):
+            lod_mesh.uv_layers.new(name=layer_name)
+    set_uv_maps(lod_mesh, lod_uvs)
+    lod_mesh.update()
+
+    # Reuse the existing proxy when there is one (reloads), otherwise make a new one
+    lod_obj = next((child for child in obj.children if child.get("forge_lod_proxy")), None)
+    if lod_obj is None:
+        lod_obj = bpy.data.objects.new(f"{obj.name}_LOD", lod_mesh)
+        for collection in obj.users_collection:
+            collection.objects.link(lod_obj)
+        lod_obj.parent = obj
+        lod_obj["forge_lod_proxy"] = True
+        lod_obj.hide_render = True
+
+        # Moving the proxy on its own would move what the viewport shows away from what renders
+        lod_obj.lock_location = (True, True, True)
+        lod_obj.lock_rotation = (True, True, True)
+        lod_obj.lock_scale = (True, True, True)
+    else:
+        old_mesh = lod_obj.data
+        lod_obj.data = lod_mesh
+        if old_mesh.users == 0:
+            bpy.data.meshes.remove(old_mesh)
+            lod_mesh.name = lod_mesh_name
+
+    obj.hide_viewport = True
+    obj["forge_lod_ratio"] = lod_ratio
+
+    print(f"Built a LOD proxy for '{obj.name}' with {len(lod_positions)} of {len(model_data['vertices'])} vertices.")
+    return lod_obj
+
+# Take an object's viewport stand-in away again.
+def remove_lod_proxy(obj: bpy.types.Object) -> None:
+    """Delete the object's LOD proxy, if it has one, and show the full detail object in the viewport again."""
+    for child in list(obj.children):
+        if child.get("forge_lod_proxy"):
+            lod_mesh = child.data
+            bpy.data.objects.remove(child)
+            if lod_mesh.users == 0:
+                bpy.data.meshes.remove(lod_mesh)
+
+    if "forge_lod_ratio" in obj:
+        del obj["forge_lod_ratio"]
+    obj.hide_viewport = False
+
+# -------------------------------------------------------------------------------------------------------------------------------------------------
+
+# -----------
+# HOT RELOAD
+# -----------
+
+# Identify a file on disk by its modification time and size.
+def get_file_identity(file_path: str) -> str:
+    """Return a string that changes whenever the file at `file_path` is modified."""
+    stat = os.stat(file_path)
+    return f"{stat.st_mtime_ns}:{stat.st_size}"
+
+# Tag an imported object with the file it came from.
+def remember_model_source(obj: bpy.types.Object, file_path: str, use_custom_normals: bool = False, reload_on_change: bool = False) -> None:
+    """Store the model's source path, file identity and import settings on the object so it can be reloaded later."""
+    obj["forge_source_path"] = os.path.abspath(file_path)
+    obj["forge_source_identity"] = get_file_identity(file_path)
+    obj["forge_custom_normals"] = use_custom_normals
+    obj["forge_reload_on_change"] = reload_on_change
+
+# Find the objects that were imported from a file.
+def get_model_objects(file_path: str) -> list[bpy.types.Object]:
+    """Return every mesh object in the current scene that was imported from the given file."""
+    source_path = os.path.abspath(file_path)
+    return [obj for obj in bpy.context.scene.objects if obj.type == 'MESH' and obj.get("forge_source_path") == source_path]
+
+# Re-parse a changed model and update its objects.
+def reload_model(file_path: str, objects: list[bpy.types.Object], rebuild: bool = False) -> None:
+    """Re-parse a model file and update every object imported from it, in place when the topology hasn't changed (unless `rebuild` is set)."""
+    print(f"\nRELOADING MODEL: {file_path}...\n")
+
+    model = ForgeMesh(file_path)
+    model_data = get_model_data(model)
+    identity = get_file_identity(file_path)
+
+    for obj in objects:
+        mesh: bpy.types.Mesh = obj.data
+        use_custom_normals = bool(obj.get("forge_custom_normals", False))
+
+        if not rebuild and mesh_topology_matches(mesh, model_data["faces"], len(model_data["vertices"])):
+            # Same topology; just move the vertices and UVs
+            mesh.vertices.foreach_set("co", np.ascontiguousarray(model_data["vertices"], dtype=np.float32).ravel())
+            set_uv_maps(mesh, model_data)
+            if use_custom_normals is False and len(model_data["normals"]):
+                mesh.normals_split_custom_set_from_vertices(model_data["normals"])
+            mesh.update()
+            refresh_weights(obj, model_data)
+            print(f"Updated '{obj.name}' in place.")
+        else:
+            # Topology changed; build a new mesh and swap it in, keeping the materials
+            mesh_name = mesh.name
+            new_mesh = build_mesh(mesh_name, model_data, use_custom_normals)
+            for material in mesh.materials:
+                new_mesh.materials.append(material)
+            obj.data = new_mesh
+            if mesh.users == 0:
+                # The new mesh got a ".001" name while the old one was still around, so take the name over
+                bpy.data.meshes.remove(mesh)
+                new_mesh.name = mesh_name
+
+            refresh_weights(obj, model_data)
+            print(f"Rebuilt '{obj.name}'.")
+
+        # Keep the viewport proxy in sync with the new geometry
+        if obj.get("forge_lod_ratio"):
+            attach_lod_proxy(obj, model_data, obj["forge_lod_ratio"])
+
+        obj["forge_source_identity"] = identity
+
+# Rebuild an object's weights, keeping them hooked up to its skeleton.
+def refresh_weights(obj: bpy.types.Object, model_data: dict) -> None:
+    """Replace the object's vertex groups with the model's weights. If the object is bound to a skeleton, the new `bone_N` groups get renamed to its bone names so the Armature modifier keeps working."""
+    obj.vertex_groups.clear()
     add_weights(obj, model_data["bone_indices"], model_data["bone_weights"])
 
-    # Finalize the mesh
-    mesh.calc_tangents()
-    mesh.update()
+    arm = get_attached_skeleton(obj)
+    if arm:
+        bone_map = {bone['id']: bone.name for bone in arm.data.bones if 'id' in bone}
+        rename_vertex_groups_to_bone_names(obj, bone_map)
 
-    print("\nMODEL IMPORT COMPLETE!")
-    return {'FINISHED'}
+# Check if a mesh has the same vertex count and faces as some model data.
+def mesh_topology_matches(mesh: bpy.types.Mesh, faces: np.ndarray, vertex_count: int) -> bool:
+    """Return `True` if the mesh has `vertex_count` vertices and the exact same triangles as `faces`."""
+    if len(mesh.vertices) != vertex_count or len(mesh.polygons) != len(faces) or len(mesh.loops) != faces.size:
+        return False
+
+    loop_vertices = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", loop_vertices)
+    return bool(np.array_equal(loop_vertices, faces.ravel()))
+
+# How often (in seconds) the watcher checks the imported models' files for changes.
+RELOAD_POLL_INTERVAL = 1.0
+
+# Timer callback that reloads any imported model whose file changed.
+def check_model_sources() -> float | None:
+    """Poll the source files of the imported models that asked to be reloaded on change, and reload the ones that changed. Stops the timer once there's nothing left to watch."""
+    watched = defaultdict(list)
+    for obj in bpy.data.objects:
+        if obj.type == 'MESH' and obj.get("forge_source_path") and obj.get("forge_reload_on_change"):
+            watched[obj["forge_source_path"]].append(obj)
+
+    if not watched:
+        return None
+
+    for (file_path, objects) in watched.items():
+        try:
+            identity = get_file_identity(file_path)
+        except OSError:
+            continue
+
+        # Objects being edited get left alone, the edit mesh would overwrite our changes anyway
+        changed = [obj for obj in objects if obj.get("forge_source_identity") != identity and obj.mode != 'EDIT']
+        if not changed:
+            continue
+
+        try:
+            reload_model(file_path, changed)
+        except OSError as error:
+            # Deleted or still locked by whatever is writing it; try again on the next poll
+            print(f"Cannot read model {file_path} yet: {error}")
+        except (ValueError, struct.error) as error:
+            # Don't keep retrying a broken file, wait until it changes again
+            print(f"Cannot reload model {file_path}: {error}")
+            for obj in changed:
+                obj["forge_source_identity"] = identity
+
+    return RELOAD_POLL_INTERVAL
+
+# Start watching the imported models' files.
+def start_model_watcher() -> None:
+    """Start polling the imported models' files for changes, if we aren't already."""
+    if not bpy.app.timers.is_registered(check_model_sources):
+        bpy.app.timers.register(check_model_sources, first_interval=RELOAD_POLL_INTERVAL, persistent=True)
+
+# Stop watching the imported models' files.
+def stop_model_watcher() -> None:
+    """Stop polling the imported models' files for changes."""
+    if bpy.app.timers.is_registered(check_model_sources):
+        bpy.app.timers.unregister(check_model_sources)
 
-    # ----------------
\ No newline at end of file
+# Pick the watcher back up when a .blend file is opened.
+@bpy.app.handlers.persistent
+def restart_model_watcher(_) -> None:
+    """`load_post` handler that starts the watcher again if the opened file has models that asked to be reloaded on change."""
+    if any(obj.get("forge_reload_on_change") for obj in bpy.data.objects if obj.type == 'MESH'):
+        start_model_watcher()
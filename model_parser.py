@@ -1,7 +1,130 @@
-import bpy
+import numpy as np
 
 from .readers import Reader
-from .bpy_util_funcs import *
+from .data_util_funcs import *
+
+# -------------------------------------------------------
+# VERTEX LAYOUTS
+# -------------------------------------------------------
+
+# Fields shared by every vertex type. (52 bytes)
+BASE_VERTEX_FIELDS = [
+    ("position", "f4", (3,)),
+    ("pad", "u2"),
+    ("normal", "i1", (4,)),         # vertex_data_A*
+    ("pad2", "u2"),
+    ("tangent", "i1", (4,)),        # vertex_data_B*
+    ("unknown", "V20"),             # Padding, vertex_data_C* and a couple of still unknown values
+    ("uv_primary", "f2", (2,)),
+    ("uv_secondary", "f2", (2,)),
+]
+
+# Size of the fields shared by every vertex type.
+BASE_VERTEX_SIZE = 52
+
+# Size of the position, the one field every vertex is sure to start with.
+POSITION_SIZE = 12
+
+# Extra fields tacked onto the end of the vertex, for every vertex type listed in the header.
+# `None` means the type's layout isn't documented yet, so its size gets worked out from the size of the file.
+EXTRA_VERTEX_FIELDS = {
+    0: None,                                                        # Color
+    2: [("unknown_color_tex", "V28")],                              # ColorTex
+    3: [],                                                          # Unskinned
+    4: None,                                                        # Skinned
+    5: None,                                                        # Position Only
+    6: None,                                                        # Particle
+    7: [("bone_weights", "u2", (4,)), ("bone_indices", "u1", (4,))],  # UnskinnedCompressed
+    8: None,                                                        # Skinned Compressed
+}
+
+# Build the NumPy record type of a vertex out of a list of fields.
+def build_vertex_layout(fields: list[tuple], little_endian: bool = True) -> np.dtype:
+    """Build the record type of a single vertex from `(name, format, [shape])` fields, in the given byte order."""
+    order = "<" if little_endian else ">"
+    return np.dtype([(name, order + fmt, *shape) for (name, fmt, *shape) in fields])
+
+# Record types of every documented vertex type, built once up front. Keyed by `(vertex type, little endian)`.
+VERTEX_LAYOUTS = {
+    (vertex_type, little_endian): build_vertex_layout(BASE_VERTEX_FIELDS + extra_fields, little_endian)
+    for (vertex_type, extra_fields) in EXTRA_VERTEX_FIELDS.items() if extra_fields is not None
+    for little_endian in (True, False)
+}
+
+# Get the NumPy record type of a vertex.
+def get_vertex_layout(vertex_type: int, little_endian: bool = True, stride: int = BASE_VERTEX_SIZE) -> np.dtype:
+    """Return the record type of a single vertex of the given vertex type, in the given byte order.
+    Undocumented vertex types get the shared fields padded out to `stride` bytes, or just the position when they're smaller than that."""
+    layout = VERTEX_LAYOUTS.get((vertex_type, little_endian))
+    if layout is not None:
+        return layout
+
+    if vertex_type not in EXTRA_VERTEX_FIELDS:
+        raise ValueError(f"Invalid vertex type {vertex_type} for the model's data!")
+    if stride < POSITION_SIZE:
+        raise ValueError(f"Vertex type {vertex_type} can't be {stride} bytes per vertex, every vertex is at least {POSITION_SIZE} bytes!")
+
+    # Too small for the shared fields, so all we can count on is the position
+    fields = BASE_VERTEX_FIELDS if stride >= BASE_VERTEX_SIZE else BASE_VERTEX_FIELDS[:1]
+    known_size = BASE_VERTEX_SIZE if stride >= BASE_VERTEX_SIZE else POSITION_SIZE
+
+    extra_fields = [("unknown_extra", f"V{stride - known_size}")] if stride > known_size else []
+    return build_vertex_layout(fields + extra_fields, little_endian)
+
+# Work out the size of each vertex from the size of the file.
+def get_vertex_stride(vertex_bytes: int, vertex_count: int) -> int:
+    """Work out how many bytes each vertex takes up from the number of bytes left over for vertex data. Raises a `ValueError` if they don't divide evenly."""
+    if vertex_bytes < 0:
+        raise ValueError(f"File is too small for its vertex and face counts! ({-vertex_bytes} bytes short)")
+    if vertex_count == 0:
+        if vertex_bytes != 0:
+            raise ValueError(f"File has {vertex_bytes} bytes of vertex data but no vertices!")
+        return BASE_VERTEX_SIZE
+    if vertex_bytes % vertex_count != 0:
+        raise ValueError(f"{vertex_bytes} bytes of vertex data doesn't divide evenly between {vertex_count} vertices!")
+    return vertex_bytes // vertex_count
+
+# Face index sizes (in bytes) that can show up in a model, in the order they get tried.
+INDEX_SIZES = (4, 2)
+
+# Work out the vertex size and face index size from the size of the file.
+def get_buffer_layout(data: bytes, offset: int, little_endian: bool, vertex_type: int, vertex_count: int, face_count: int) -> tuple[int, int]:
+    """Work out the vertex stride and the face index size (4 or 2 bytes) of the vertex and face data starting at `offset`.
+    A combination only fits if its size adds up and every face index it reads is in range. Raises a `ValueError` if none fit."""
+    data_bytes = len(data) - offset
+    first_error = None
+    for index_size in INDEX_SIZES:
+        # 16 bit indices can't reach past 65,536 vertices
+        if index_size == 2 and vertex_count > 0x10000:
+            continue
+
+        try:
+            stride = get_vertex_stride(data_bytes - (face_count * 3 * index_size), vertex_count)
+            layout = get_vertex_layout(vertex_type, True, stride)
+            if vertex_count and layout.itemsize != stride:
+                raise ValueError(f"Vertex type {vertex_type} should be {layout.itemsize} bytes per vertex, but the file size works out to {stride}!")
+
+            # The sizes can add up for the wrong index size too (16 bit indices read as 32 bit ones), so check they actually point at vertices
+            index_format = ("<" if little_endian else ">") + ("u2" if index_size == 2 else "u4")
+            faces = np.frombuffer(data, dtype=index_format, count=face_count * 3, offset=offset + (vertex_count * stride))
+            if faces.size and faces.max() >= vertex_count:
+                raise ValueError(f"Faces reference vertex {faces.max()}, but the model only has {vertex_count} vertices!")
+        except ValueError as error:
+            first_error = first_error or error
+            continue
+
+        return stride, index_size
+
+    raise first_error
+
+# Smallest integer type that can index every vertex.
+def get_index_dtype(vertex_count: int) -> np.dtype:
+    """Return the narrowest unsigned integer type that can hold every vertex index of a mesh with `vertex_count` vertices."""
+    if vertex_count <= 0x100:
+        return np.dtype(np.uint8)
+    if vertex_count <= 0x10000:
+        return np.dtype(np.uint16)
+    return np.dtype(np.uint32)
 
 class ForgeMesh():
     """Forge model format class. Used for Rock Band 4 and VR models"""
@@ -124,59 +247,45 @@ class ForgeMesh():
         # VERTEX DATA
         # ------------
 
-        vertices = []
-        uv1 = []
-        uv2 = []
-        bone_indices = []
-        bone_weights = []
+        # Everything after the header is the vertices followed by the faces, so check the counts against the file size
+        # before touching any of it. This also tells us the size of the face indices, and the vertex size of undocumented vertex types.
+        vertex_stride, index_size = get_buffer_layout(reader.data, reader.tell(), reader.LE, vertexType, vertexCount, faceCount)
+        print(f"Vertex Stride: {vertex_stride}")
+        print(f"Face Index Size: {index_size * 8} bit")
 
-        for (_) in (range(vertexCount)):
-            vertices.append(reader.vec3f())
+        vertex_layout = get_vertex_layout(vertexType, reader.LE, vertex_stride)
 
-            vertex_pad = reader.ushort()
-            
-            vertex_data_A1 = reader.ubyte()
-            vertex_data_A2 = reader.ubyte()
-            vertex_data_A3 = reader.ubyte()
-            vertex_data_A4 = reader.ubyte()
+        # Every vertex of a given type is the same size, so the whole block is viewed straight out of the file's buffer as
+        # one array of records instead of being read field by field.
+        vertex_records = np.frombuffer(reader.data, dtype=vertex_layout, count=vertexCount, offset=reader.tell())
+        reader.seek(vertexCount * vertex_layout.itemsize)
 
-            vertex_pad2 = reader.ushort()
+        # Keep everything little endian from here on (PS4 files are big endian)
+        if not reader.LE:
+            vertex_records = vertex_records.astype(get_vertex_layout(vertexType, True, vertex_stride))
 
-            vertex_data_B1 = reader.ubyte()
-            vertex_data_B2 = reader.ubyte()
-            vertex_data_B3 = reader.ubyte()
-            vertex_data_B4 = reader.ubyte()
+        vertices = vertex_records["position"]
 
-            vertex_pad3 = reader.int32()
+        # Small undocumented vertex types only have a known position; everything else is left empty for them
+        if "uv_primary" in vertex_layout.names:
+            uv1 = invert_uv_maps(vertex_records["uv_primary"])
+            uv2 = invert_uv_maps(vertex_records["uv_secondary"])
 
-            vertex_pad4 = reader.byte()
-            vertex_pad5 = reader.byte()
-
-            vertex_data_C1 = reader.ubyte()
-            vertex_data_C2 = reader.ubyte()
-            vertex_data_C3 = reader.ubyte()
-
-            vertex_interesting_int = reader.int32()
-            vertex_interesting_short = reader.short()
-
-            vertex_pad4 = reader.ushort()
-            vertex_pad5 = reader.ushort()
-            vertex_pad4 = reader.byte()
-
-            uv_primary = invert_uv_map(reader.vec2hf())
-            uv_secondary = invert_uv_map(reader.vec2hf())
-
-            uv1.append(uv_primary)
-            uv2.append(uv_secondary)
-
-            if vertexType == 2:      # ColorTex
-                vertex_unk_ColorTex = reader.read_bytes(80 - 52)
-            elif vertexType == 7:    # UnskinnedCompressed
-                weights = [reader.ushort() for (_) in range(4)]
-                ids = [reader.ubyte() for (_) in range(4)]
-
-                bone_weights.append(weights)
-                bone_indices.append(ids)
+            # -- NORMALS
+            # These are stored as signed bytes in every vertex (vertex_data_A*). The tangents (vertex_data_B*) stay in the vertex records.
+            normals = convert_vertex_normals(vertex_records["normal"][:, :3])
+        else:
+            uv1 = np.zeros((0, 2), dtype=np.float32)
+            uv2 = np.zeros((0, 2), dtype=np.float32)
+            normals = np.zeros((0, 3), dtype=np.float32)
+
+        # -- BONE WEIGHTS
+        if "bone_weights" in vertex_layout.names:
+            bone_weights = vertex_records["bone_weights"]
+            bone_indices = vertex_records["bone_indices"]
+        else:
+            bone_weights = np.zeros((0, 4), dtype=np.uint16)
+            bone_indices = np.zeros((0, 4), dtype=np.uint8)
 
         # --------------------------------------------------------------------------------------------------------
 
@@ -184,9 +293,12 @@ class ForgeMesh():
         # FACES
         # ------
 
-        faces = []
-        for (_) in (range(faceCount)):
-            faces.append(reader.vec3i())
+        index_format = ("<" if reader.LE else ">") + ("u2" if index_size == 2 else "u4")
+        faces = np.frombuffer(reader.data, dtype=index_format, count=faceCount * 3, offset=reader.tell()).reshape(-1, 3)
+        reader.seek(faceCount * 3 * index_size)
+
+        # Keep the faces in the smallest integer type that fits, they only get widened when handed to Blender
+        faces = faces.astype(get_index_dtype(vertexCount), copy=False)
 
         # -------------------------------------------
 
@@ -199,8 +311,10 @@ class ForgeMesh():
             "uv_map_1": uv1,
             "uv_map_2": uv2,
             "faces": faces,
+            "normals": normals,
             "bone_indices": bone_indices,
             "bone_weights": bone_weights,
+            "vertex_records": vertex_records,
         }
 
         master_data_list.append(mesh_data_dict)
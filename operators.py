@@ -0,0 +1,167 @@
+# -----------------------------------------------------
+#   OPERATORS
+#       The plugin's import operators and
+#       their registration with Blender
+# -----------------------------------------------------
+""" The plugin's import operators and their registration with Blender. """
+
+# --------
+# IMPORTS
+# --------
+
+import bpy, os, random
+from typing import cast
+
+from .readers import Reader
+from .model_importer import import_model, start_model_watcher, stop_model_watcher, restart_model_watcher
+from .texture_importer import import_texture
+from .skeleton_importer import import_skeleton
+from .bpy_util_funcs import *
+
+from bpy_extras.io_utils import ImportHelper
+from bpy.props import StringProperty, BoolProperty, EnumProperty, CollectionProperty, FloatProperty
+from bpy.types import Operator, OperatorFileListElement
+
+# -----------------------------------------------------
+
+class ImportForgeMesh(Operator, ImportHelper):
+    bl_idname = "import_forge.mesh"
+    bl_label = "Import Forge Mesh (.forgemesh)"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    filename_ext = ".forgemesh"
+
+    filter_glob: StringProperty(
+        default="*.forgemesh",
+        options={'HIDDEN'},
+        maxlen=1024,
+    ) # type: ignore
+
+    custom_normals: BoolProperty(
+        name="Custom Normals",
+        description="Rather than using the original normals, re-calculate them when the meshes are created. (Looks smoother)",
+        default=True,
+    ) # type: ignore
+
+    assign_material_colors: BoolProperty(
+        name="Assign Material Colors",
+        description="Assign random colors to the model's materials to help with distingushing submeshes",
+        default=True,
+    ) # type: ignore
+
+    reload_on_change: BoolProperty(
+        name="Reload On Change",
+        description="Watch the imported file and update the model in place whenever the file changes on disk",
+        default=False,
+    ) # type: ignore
+
+    build_lod_proxy: BoolProperty(
+        name="Build LOD Proxy",
+        description="Show a reduced version of the model in the viewport to keep big scenes responsive. The full model is still used for rendering",
+        default=False,
+    ) # type: ignore
+
+    lod_ratio: FloatProperty(
+        name="LOD Ratio",
+        description="Roughly how much of the model's vertices the viewport proxy keeps",
+        default=0.25,
+        min=0.01,
+        max=1.0,
+        subtype='FACTOR',
+    ) # type: ignore
+
+    def execute(self, context):
+        lod_ratio = self.lod_ratio if self.build_lod_proxy else 0.0
+        result = import_model(self.filepath, self.custom_normals, self.assign_material_colors, lod_ratio, self.reload_on_change)
+        if self.reload_on_change:
+            start_model_watcher()
+        return result
+    
+class ImportForgeSkel(Operator, ImportHelper):
+    bl_idname = "import_forge.skel"
+    bl_label = "Import Forge Skeleton (.skel_pc/ps4)"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    filename_ext = ".skel_pc"
+
+    filter_glob: StringProperty(
+        default="*.skel_pc;*.skel_ps4",
+        options={'HIDDEN'},
+        maxlen=1024,
+    ) # type: ignore
+
+    def execute(self, context):
+        return import_skeleton(context, self.filepath)
+
+class ImportForgeTex(Operator, ImportHelper):
+    bl_idname = "import_forge.tex"
+    bl_label = "Import Forge Texture (.bmp_pc/ps4 | .png_pc/ps4)"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    filename_ext = ".bmp_pc"
+
+    filter_glob: StringProperty(
+        default="*.bmp_pc;*.bmp_ps4;*.png_pc;*.png_ps4",
+        options={'HIDDEN'},
+        maxlen=1024,
+    ) # type: ignore
+
+    files: CollectionProperty(
+        type=OperatorFileListElement,
+        options={'HIDDEN', 'SKIP_SAVE'},
+    ) # type: ignore
+
+    directory: StringProperty(
+        subtype='DIR_PATH',
+    ) # type: ignore
+
+    texture_format: EnumProperty(
+        name="Texture Format",
+        description="Pixel format of the textures. BC5 (normal maps) is the same size as BC3 and has to be picked by hand",
+        items=[
+            ('AUTO', "Auto", "Work out the format from the size of the texture"),
+            ('BC1', "BC1 (DXT1)", "Color textures without alpha"),
+            ('BC3', "BC3 (DXT5)", "Color textures with alpha"),
+            ('BC5', "BC5 (ATI2)", "Two channel normal maps"),
+            ('RGBA8', "RGBA8", "Uncompressed textures"),
+        ],
+        default='AUTO',
+    ) # type: ignore
+
+    pack_images: BoolProperty(
+        name="Pack Images",
+        description="Pack the imported images into the .blend file so they survive saving it. Turn off to speed up big batches, but save the images somewhere before saving the .blend",
+        default=True,
+    ) # type: ignore
+
+    def execute(self, context):
+        # Import every selected texture; shared ones only get decoded once
+        file_paths = [os.path.join(self.directory, file.name) for file in self.files if file.name] or [self.filepath]
+        for file_path in file_paths:
+            import_texture(context, file_path, self.texture_format, self.pack_images)
+        return {'FINISHED'}
+        
+def menu_func_import(self, context):
+    self.layout.operator(ImportForgeMesh.bl_idname, text="Forge Mesh (.forgemesh)")
+    self.layout.operator(ImportForgeTex.bl_idname, text="Forge Texture (.bmp_pc/ps4 | .png_pc/ps4)")
+    self.layout.operator(ImportForgeSkel.bl_idname, text="Forge Skeleton (.skel_pc/ps4)")
+
+def register():
+    bpy.utils.register_class(ImportForgeMesh)
+    bpy.utils.register_class(ImportForgeTex)
+    bpy.utils.register_class(ImportForgeSkel)
+    bpy.types.TOPBAR_MT_file_import.append(menu_func_import)
+
+    # Models saved with Reload On Change keep reloading after the .blend is opened again
+    bpy.app.handlers.load_post.append(restart_model_watcher)
+
+def unregister():
+    if restart_model_watcher in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(restart_model_watcher)
+    stop_model_watcher()
+    bpy.utils.unregister_class(ImportForgeMesh)
+    bpy.utils.unregister_class(ImportForgeTex)
+    bpy.utils.unregister_class(ImportForgeSkel)
+    bpy.types.TOPBAR_MT_file_import.remove(menu_func_import)
+
+    # --------------------------------------------------------------------------------------------------------
\ No newline at end of file
@@ -5,8 +5,7 @@
 """ Module with helper classes for reading binary file data. """
 
 import os
-import bpy, struct, math
-import mathutils
+import struct, math
 
 # -----------------------------------------------------
 
@@ -0,0 +1,128 @@
+# ------------------------------------------------
+#   SKELETON IMPORTER / BUILDER
+#       Takes the parsed skeleton data and
+#       builds it into Blender's scene as an armature
+# ------------------------------------------------
+"""
+Takes the parsed skeleton data and builds it into Blender's scene as an armature.
+"""
+
+import os
+import bpy
+import math
+import numpy as np
+
+from .skeleton_parser import ForgeSkeleton
+from .bpy_util_funcs import *
+
+# Import the skeleton!
+def import_skeleton(context: bpy.types.Context, file_path: str):
+    """Import a skeleton and construct it in Blender."""
+
+    print(f"\nIMPORTING SKELETON: {file_path}...\n")
+
+    # Make sure the file exists!
+    if not os.path.exists(file_path):
+        print(f"Cannot import skeleton; file not found at: {file_path}")
+        return {'FINISHED'}
+
+    skeleton = ForgeSkeleton(file_path)
+    bone_count = len(skeleton.bone_names)
+
+    # Extract the filename for armature naming
+    skeleton_name = os.path.splitext(os.path.basename(file_path))[0]
+    print(f"\nBuilding Armature: {skeleton_name}")
+
+    # Create a new Blender armature and object
+    arm_data = bpy.data.armatures.new(name=skeleton_name)
+    arm_obj = bpy.data.objects.new(skeleton_name, arm_data)
+    context.scene.collection.objects.link(arm_obj)
+
+    # Rotate the armature 90 degrees upwards, same as the models
+    arm_obj.rotation_euler[0] += math.radians(90)
+
+    # Work out every bone's head and tail at once. The bone points down its local Y axis (second matrix row)
+    heads = skeleton.bone_matrices[:, 3, :3]
+    y_axes = skeleton.bone_matrices[:, 1, :3]
+    y_lengths = np.linalg.norm(y_axes, axis=1, keepdims=True)
+    y_axes = np.divide(y_axes, y_lengths, out=np.tile(np.array([0.0, 1.0, 0.0], dtype=np.float32), (bone_count, 1)), where=y_lengths > 0)
+
+    extent = float(np.ptp(heads, axis=0).max()) if bone_count else 0.0
+    bone_length = max(extent * 0.02, 0.01)
+    tails = heads + (y_axes * bone_length)
+
+    heads = heads.tolist()
+    tails = tails.tolist()
+    parents = skeleton.bone_parents.tolist()
+    ids = skeleton.bone_ids.tolist()
+
+    # Edit bones can only be made in edit mode, so go in once, make all of them, then come back out.
+    if context.mode != 'OBJECT':
+        bpy.ops.object.mode_set(mode='OBJECT')
+    context.view_layer.objects.active = arm_obj
+    bpy.ops.object.mode_set(mode='EDIT')
+
+    edit_bones = arm_data.edit_bones
+    new_bones = []
+    bone_map = {}
+    for (name, head, tail, bone_id) in zip(skeleton.bone_names, heads, tails, ids):
+        edit_bone = edit_bones.new(name)
+        edit_bone.head = head
+        edit_bone.tail = tail
+        edit_bone["id"] = bone_id
+        new_bones.append(edit_bone)
+
+        # Blender renames duplicate bones and cuts long names short, so map to the name the bone actually got
+        bone_map[bone_id] = edit_bone.name
+
+    # Parent by index into the bones we just made, rather than looking them up by name
+    for (edit_bone, parent) in zip(new_bones, parents):
+        if parent >= 0:
+            edit_bone.parent = new_bones[parent]
+
+    bpy.ops.object.mode_set(mode='OBJECT')
+    print(f"  Built {bone_count} bones.")
+
+    # Bind any imported meshes that are still waiting on a skeleton
+    bind_meshes_to_skeleton(context, arm_obj, bone_map)
+
+    print("\nSKELETON IMPORT COMPLETE!")
+    return {'FINISHED'}
+
+# Hook up the meshes' "bone_N" vertex groups to a freshly imported skeleton.
+def bind_meshes_to_skeleton(context: bpy.types.Context, arm_obj: bpy.types.Object, bone_map: dict) -> None:
+    """Parent every unbound mesh in the scene whose `bone_N` vertex groups all exist in this skeleton to it, give it an Armature modifier and rename its groups to the bone names."""
+
+    for obj in context.scene.objects:
+        # Only meshes that came in with bone groups and don't already have a skeleton
+        if obj.type != 'MESH' or get_attached_skeleton(obj):
+            continue
+
+        # ...and only the ones made for this skeleton, so other characters' meshes are left alone
+        bone_indices = get_vertex_group_bone_indices(obj)
+        if not bone_indices or not all(bone_index in bone_map for bone_index in bone_indices):
+            continue
+
+        rename_vertex_groups_to_bone_names(obj, bone_map)
+
+        modifier = obj.modifiers.new(name="Armature", type='ARMATURE')
+        modifier.object = arm_obj
+
+        # Keep the mesh where it is; both it and the armature carry the same 90 degree rotation
+        obj.parent = arm_obj
+        obj.matrix_parent_inverse = arm_obj.matrix_basis.inverted()
+
+        print(f"Bound mesh '{obj.name}' to skeleton '{arm_obj.name}'")
+
+# Pull the bone indexes out of a mesh's "bone_N" vertex groups.
+def get_vertex_group_bone_indices(obj: bpy.types.Object) -> list[int] | None:
+    """Return the bone index of every `bone_N` vertex group on the object. Returns `None` if it has a group that isn't in that format."""
+    bone_indices = []
+    for group in obj.vertex_groups:
+        if not group.name.startswith("bone_"):
+            return None
+        try:
+            bone_indices.append(int(group.name[len("bone_"):]))
+        except ValueError:
+            return None
+    return bone_indices
@@ -0,0 +1,121 @@
+import numpy as np
+
+from .readers import Reader
+from .data_util_funcs import *
+
+# Largest bone ID that fits in a Blender custom property. (Signed 32 bit int)
+MAX_BONE_ID = 0x7FFFFFFF
+
+class ForgeSkeleton():
+    """Forge skeleton format class. Used for Rock Band 4 and VR skeletons (.skel_pc / .skel_ps4)"""
+    # Class constructor.
+    def __init__(self, file_path: str):
+        """Forge skeleton format class. Used for Rock Band 4 and VR skeletons (.skel_pc / .skel_ps4)"""
+
+        # Class init stuff
+        super().__init__()
+
+        # -------------------------------
+        # -- CLASS MEMBERS --------------
+        # -------------------------------
+
+        # -- SKELETON FILE
+        self.skeleton_file: str = file_path
+        """The path to the skeleton file."""
+
+        # -- BONE NAMES
+        self.bone_names: list[str] = []
+        """Names of every bone, in file order."""
+
+        # -- BONE IDS
+        self.bone_ids: np.ndarray = np.zeros(0, dtype=np.uint32)
+        """The index each bone is referenced by in the meshes' `bone_N` vertex groups."""
+
+        # -- BONE PARENTS
+        self.bone_parents: np.ndarray = np.zeros(0, dtype=np.int32)
+        """The parent of each bone as an index into the bone table. (-1 for root bones)"""
+
+        # -- BONE MATRICES
+        self.bone_matrices: np.ndarray = np.zeros((0, 4, 4), dtype=np.float32)
+        """The world space rest matrix of each bone. (Row-major, translation in the last row)"""
+
+        # -------------------------------
+        # -- PARSE THE DATA -------------
+        # -------------------------------
+
+        # Parse our skeleton file here!
+        self.parse_skeleton_file()
+
+    # Main skeleton parser!
+    def parse_skeleton_file(self):
+        """ Parse the skeleton file itself! """
+        print(f"Parsing skeleton data...\n")
+
+        # -------------------------------
+        # Initialize the reader
+        reader = Reader(open(self.skeleton_file, "rb").read())
+        # -------------------------------
+
+        # -------
+        # HEADER
+        # -------
+
+        magic = reader.read_string(8)
+        print(f"Magic: {magic}")
+
+        endianness = reader.uint32()
+        if endianness == 1:
+            reader.LE = True
+            print("Endianness: Little")
+        elif endianness == 0:
+            reader.LE = False
+            print("Endianness: Big")
+        else:
+            raise ValueError("Unable to determine endianness for the skeleton's data!")
+
+        version = reader.uint32()
+        print(f"Skeleton Version: {version}")
+
+        boneCount = reader.uint32()
+        print(f"Bone Count: {boneCount}")
+
+        # --------------------------------------------------------------------------------------------------------
+
+        # -----------
+        # BONE TABLE
+        # -----------
+
+        # Every bone record is the same size, so the whole table gets decoded in one go.
+        order = "<" if reader.LE else ">"
+        bone_record = np.dtype([
+            ("parent", order + "i4"),
+            ("id", order + "u4"),
+            ("matrix", order + "f4", (4, 4)),
+        ])
+
+        if reader.tell() + (boneCount * bone_record.itemsize) > reader.length:
+            raise ValueError("Bone table runs past the end of the skeleton file!")
+
+        bone_table = np.frombuffer(reader.data, dtype=bone_record, count=boneCount, offset=reader.tell())
+        reader.seek(boneCount * bone_record.itemsize)
+
+        self.bone_parents = bone_table["parent"].astype(np.int32)
+        self.bone_ids = bone_table["id"].astype(np.uint32)
+        self.bone_matrices = bone_table["matrix"].astype(np.float32)
+
+        if np.any(self.bone_parents >= boneCount):
+            raise ValueError("Bone table references a parent bone that doesn't exist!")
+
+        # Blender stores the IDs as signed 32 bit custom properties
+        if np.any(self.bone_ids > MAX_BONE_ID):
+            raise ValueError(f"Bone table has a bone ID that's out of range! ({self.bone_ids.max()})")
+
+        # -----------
+        # BONE NAMES
+        # -----------
+
+        self.bone_names = [reader.read_string(reader.uint32()) for (_) in range(boneCount)]
+
+        print(f"\nSKELETON PARSING COMPLETE!")
+
+        # -------------------------------------------
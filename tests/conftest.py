@@ -0,0 +1,18 @@
+# ------------------------------------------------
+#   TEST SETUP
+#       Loads the add-on folder as a package so
+#       the bpy-free modules can be imported
+# ------------------------------------------------
+
+import sys
+import importlib.util
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# The add-on only pulls in its Blender operators when bpy is around, so the package itself imports fine without Blender
+if "io_scene_forge" not in sys.modules:
+    spec = importlib.util.spec_from_file_location("io_scene_forge", ROOT / "__init__.py", submodule_search_locations=[str(ROOT)])
+    package = importlib.util.module_from_spec(spec)
+    sys.modules["io_scene_forge"] = package
+    spec.loader.exec_module(package)
@@ -0,0 +1,42 @@
+# ------------------------------------------------
+#   SYNTHETIC FORGE FILES
+#       Builds small model files in memory for
+#       the parser and exporter tests
+# ------------------------------------------------
+
+import struct
+
+import numpy as np
+
+# Header size: magic, endianness, version, vertex type, counts, 4 bools, keepMeshData, flags, unknown and 4 floats
+HEADER_SIZE = 61
+
+# Vertex size of each vertex type used in the tests. The undocumented ones can be any size, so use one of each kind.
+STRIDES = {0: 16, 2: 80, 3: 52, 4: 72, 5: 12, 6: 56, 7: 64, 8: 72}
+
+# Where the primary UVs sit in every vertex that has the shared fields
+UV_PRIMARY_OFFSET = 44
+
+# A couple of triangles that use every one of 4 vertices
+QUAD_FACES = np.array([[0, 1, 2], [2, 1, 3]])
+
+# Build the bytes of a synthetic model file.
+def build_model(vertex_type: int, vertex_count: int, faces: np.ndarray, index_size: int, little_endian: bool = True, stride: int = None,
+                uvs: np.ndarray = None) -> bytes:
+    """Build a model file with `vertex_count` vertices at x = 0, 1, 2... and the given faces, written with `index_size` byte indices.
+    `uvs` fills in the primary UVs, for vertex types that have them."""
+    stride = stride or STRIDES[vertex_type]
+    order = "<" if little_endian else ">"
+
+    header = b"FORGEMSH" + struct.pack(order + "5I", int(little_endian), 1, vertex_type, vertex_count, len(faces))
+    header += bytes(4) + bytes(1) + struct.pack(order + "3I4f", 0, 0, 0, 0, 0, 0, 0)
+    assert len(header) == HEADER_SIZE
+
+    vertex_data = bytearray(vertex_count * stride)
+    for vertex in range(vertex_count):
+        struct.pack_into(order + "3f", vertex_data, vertex * stride, float(vertex), 0.0, 0.0)
+        if uvs is not None:
+            struct.pack_into(order + "2e", vertex_data, vertex * stride + UV_PRIMARY_OFFSET, *uvs[vertex])
+
+    face_data = np.asarray(faces, dtype=order + ("u2" if index_size == 2 else "u4")).tobytes()
+    return header + bytes(vertex_data) + face_data
@@ -0,0 +1,96 @@
+# ------------------------------------------------
+#   GLTF EXPORTER TESTS
+#       Exports synthetic meshes and reads the
+#       written .glb files back
+# ------------------------------------------------
+
+import json
+import struct
+
+import numpy as np
+import pytest
+
+from io_scene_forge.gltf_exporter import export_directory, write_glb
+from io_scene_forge.model_parser import ForgeMesh
+from forge_files import QUAD_FACES, build_model
+
+# Read a .glb file back into its JSON and BIN chunks.
+def read_glb(glb_path) -> tuple[dict, bytes]:
+    """Split a binary glTF file into its parsed JSON chunk and its BIN chunk."""
+    data = glb_path.read_bytes()
+    json_length = struct.unpack_from("<I", data, 12)[0]
+    gltf = json.loads(data[20:20 + json_length])
+    bin_length = struct.unpack_from("<I", data, 20 + json_length)[0]
+    return gltf, data[28 + json_length:28 + json_length + bin_length]
+
+# Read an accessor's values out of the BIN chunk.
+def read_accessor(gltf: dict, bin_chunk: bytes, accessor_index: int, dtype: str, components: int) -> np.ndarray:
+    """Return the values of a float or integer accessor as a `(count, components)` array."""
+    accessor = gltf["accessors"][accessor_index]
+    view = gltf["bufferViews"][accessor["bufferView"]]
+    item_size = np.dtype(dtype).itemsize * components
+    stride = view.get("byteStride", item_size)
+    start = view["byteOffset"] + accessor.get("byteOffset", 0)
+    return np.stack([np.frombuffer(bin_chunk, dtype=dtype, count=components, offset=start + index * stride) for index in range(accessor["count"])])
+
+# Write a synthetic model to disk.
+def write_model(tmp_path, data: bytes, name: str = "test.forgemesh"):
+    """Write `data` to a model file and return its path."""
+    model_path = tmp_path / name
+    model_path.write_bytes(data)
+    return model_path
+
+UVS = np.array([[0.0, 0.0], [1.0, 0.0], [0.0, 0.25], [1.0, 0.75]])
+
+# -------------------------------------------------------------------------------------------------------------------------------------------------
+
+@pytest.mark.parametrize("little_endian", [True, False])
+def test_uvs_keep_file_orientation(tmp_path, little_endian):
+    model_path = write_model(tmp_path, build_model(3, 4, QUAD_FACES, 4, little_endian, uvs=UVS))
+    glb_path = tmp_path / "test.glb"
+    write_glb(ForgeMesh(str(model_path)), str(glb_path))
+
+    gltf, bin_chunk = read_glb(glb_path)
+    attributes = gltf["meshes"][0]["primitives"][0]["attributes"]
+    np.testing.assert_array_equal(read_accessor(gltf, bin_chunk, attributes["TEXCOORD_0"], "<f4", 2), UVS)
+    np.testing.assert_array_equal(read_accessor(gltf, bin_chunk, attributes["POSITION"], "<f4", 3)[:, 0], [0, 1, 2, 3])
+    np.testing.assert_array_equal(read_accessor(gltf, bin_chunk, gltf["meshes"][0]["primitives"][0]["indices"], "<u1", 1).reshape(-1, 3), QUAD_FACES)
+
+def test_no_uvs_without_shared_fields(tmp_path):
+    model_path = write_model(tmp_path, build_model(5, 4, QUAD_FACES, 4))
+    glb_path = tmp_path / "test.glb"
+    write_glb(ForgeMesh(str(model_path)), str(glb_path))
+
+    gltf, _ = read_glb(glb_path)
+    assert set(gltf["meshes"][0]["primitives"][0]["attributes"]) == {"POSITION"}
+
+@pytest.mark.parametrize("include_weights", [False, True])
+def test_weights_are_opt_in(tmp_path, include_weights):
+    model_path = write_model(tmp_path, build_model(7, 4, QUAD_FACES, 4))
+    glb_path = tmp_path / "test.glb"
+    write_glb(ForgeMesh(str(model_path)), str(glb_path), include_weights)
+
+    gltf, _ = read_glb(glb_path)
+    attributes = gltf["meshes"][0]["primitives"][0]["attributes"]
+    assert ("WEIGHTS_0" in attributes) == include_weights
+    assert ("JOINTS_0" in attributes) == include_weights
+
+def test_export_directory_skips_bad_files(tmp_path, capsys):
+    input_dir = tmp_path / "in"
+    output_dir = tmp_path / "out"
+    input_dir.mkdir()
+    write_model(input_dir, build_model(3, 4, QUAD_FACES, 4), "good.forgemesh")
+    write_model(input_dir, build_model(3, 4, QUAD_FACES, 4)[:-8], "truncated.forgemesh")
+
+    # A folder in the way of the output file makes the write fail with an OSError
+    write_model(input_dir, build_model(3, 4, QUAD_FACES, 4), "blocked.forgemesh")
+    (output_dir / "blocked.glb").mkdir(parents=True)
+
+    export_directory(str(input_dir), str(output_dir))
+    assert (output_dir / "good.glb").is_file()
+    assert not (output_dir / "truncated.glb").exists()
+
+    output = capsys.readouterr().out
+    assert "Skipping truncated.forgemesh" in output
+    assert "Skipping blocked.forgemesh" in output
+    assert "Converted 1 meshes (2 skipped)" in output
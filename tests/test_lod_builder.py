@@ -0,0 +1,55 @@
+# ------------------------------------------------
+#   LOD BUILDER TESTS
+#       Reduces a simple grid mesh and checks the
+#       result is still a valid triangle mesh
+# ------------------------------------------------
+
+import numpy as np
+import pytest
+
+from io_scene_forge.lod_builder import build_lod
+
+# Build a flat, wavy grid of triangles.
+def build_grid(size: int) -> tuple[np.ndarray, np.ndarray]:
+    """Build a `size` x `size` vertex grid with two triangles per cell. Returns `(positions, faces)`."""
+    x, y = np.meshgrid(np.arange(size, dtype=np.float32), np.arange(size, dtype=np.float32))
+    positions = np.stack((x.ravel(), y.ravel(), np.sin(x.ravel()) * 0.5), axis=1)
+
+    corner = (np.arange(size - 1)[None, :] + (np.arange(size - 1) * size)[:, None]).ravel()
+    faces = np.concatenate((
+        np.stack((corner, corner + 1, corner + size), axis=1),
+        np.stack((corner + 1, corner + size + 1, corner + size), axis=1),
+    ))
+    return positions, faces
+
+# -------------------------------------------------------------------------------------------------------------------------------------------------
+
+@pytest.mark.parametrize("target_ratio", [0.05, 0.25, 0.5])
+def test_build_lod(target_ratio):
+    positions, faces = build_grid(40)
+    lod_positions, lod_faces, source_vertices = build_lod(positions, faces, target_ratio)
+
+    assert 0 < len(lod_positions) < len(positions)
+    assert len(source_vertices) == len(lod_positions)
+
+    # Every face points at a real vertex, and every vertex is used
+    assert lod_faces.min() >= 0 and lod_faces.max() < len(lod_positions)
+    assert len(np.unique(lod_faces)) == len(lod_positions)
+
+    # No collapsed triangles...
+    assert np.all((lod_faces[:, 0] != lod_faces[:, 1]) & (lod_faces[:, 1] != lod_faces[:, 2]) & (lod_faces[:, 0] != lod_faces[:, 2]))
+
+    # ...and no triangle twice, in any winding
+    assert len(np.unique(np.sort(lod_faces, axis=1), axis=0)) == len(lod_faces)
+
+    # The source vertex of each new vertex is one of the vertices merged into it, so it's nearby
+    cell_size = np.ptp(positions, axis=0).max() / np.sqrt(len(lod_positions))
+    assert np.all(np.linalg.norm(positions[source_vertices] - lod_positions, axis=1) < cell_size * 2)
+
+def test_build_lod_full_ratio():
+    positions, faces = build_grid(5)
+    lod_positions, lod_faces, source_vertices = build_lod(positions, faces, 1.0)
+
+    np.testing.assert_array_equal(lod_positions, positions)
+    np.testing.assert_array_equal(lod_faces, faces)
+    np.testing.assert_array_equal(source_vertices, np.arange(len(positions)))
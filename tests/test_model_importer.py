@@ -0,0 +1,38 @@
+# ------------------------------------------------
+#   MODEL IMPORTER TESTS
+#       Builds synthetic meshes in Blender. Only
+#       runs where bpy can be imported
+# ------------------------------------------------
+
+import numpy as np
+import pytest
+
+bpy = pytest.importorskip("bpy")
+
+from io_scene_forge.model_importer import build_mesh, get_model_data
+from io_scene_forge.model_parser import ForgeMesh
+from forge_files import QUAD_FACES, build_model
+
+# Parse a synthetic model and build its Blender mesh.
+def build(tmp_path, data: bytes) -> bpy.types.Mesh:
+    """Write `data` to a model file, parse it and build it into a Blender mesh."""
+    model_path = tmp_path / "test.forgemesh"
+    model_path.write_bytes(data)
+    return build_mesh("test", get_model_data(ForgeMesh(str(model_path))))
+
+# -------------------------------------------------------------------------------------------------------------------------------------------------
+
+@pytest.mark.parametrize("vertex_type", [0, 5, 6])
+def test_build_mesh_without_uvs(tmp_path, vertex_type):
+    # Position Only style vertices are too small for UVs, and tangents can't be worked out without them
+    mesh = build(tmp_path, build_model(vertex_type, 4, QUAD_FACES, 4, stride=12))
+    assert len(mesh.uv_layers) == 0
+    assert len(mesh.vertices) == 4
+    assert len(mesh.polygons) == len(QUAD_FACES)
+    bpy.data.meshes.remove(mesh)
+
+def test_build_mesh_with_uvs(tmp_path):
+    uvs = np.array([[0.0, 0.0], [1.0, 0.0], [0.0, 1.0], [1.0, 1.0]])
+    mesh = build(tmp_path, build_model(3, 4, QUAD_FACES, 4, uvs=uvs))
+    assert [layer.name for layer in mesh.uv_layers] == ["UV_01", "UV_02"]
+    bpy.data.meshes.remove(mesh)
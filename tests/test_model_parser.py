@@ -0,0 +1,72 @@
+# ------------------------------------------------
+#   MODEL PARSER TESTS
+#       Builds small synthetic meshes and checks
+#       they parse back the way they were written
+# ------------------------------------------------
+
+import numpy as np
+import pytest
+
+from io_scene_forge.model_parser import ForgeMesh, get_buffer_layout, get_vertex_layout
+from forge_files import HEADER_SIZE, STRIDES, QUAD_FACES, build_model
+
+# Write a synthetic model and parse it back.
+def parse(tmp_path, data: bytes) -> dict:
+    """Write `data` to a model file and parse it. Returns the first mesh."""
+    model_path = tmp_path / "test.forgemesh"
+    model_path.write_bytes(data)
+    return ForgeMesh(str(model_path)).mesh_data[0]
+
+# -------------------------------------------------------------------------------------------------------------------------------------------------
+
+@pytest.mark.parametrize("little_endian", [True, False])
+@pytest.mark.parametrize("index_size", [4, 2])
+@pytest.mark.parametrize("vertex_type", sorted(STRIDES))
+def test_buffer_layout(vertex_type, index_size, little_endian):
+    data = build_model(vertex_type, 4, QUAD_FACES, index_size, little_endian)
+    assert get_buffer_layout(data, HEADER_SIZE, little_endian, vertex_type, 4, len(QUAD_FACES)) == (STRIDES[vertex_type], index_size)
+
+@pytest.mark.parametrize("little_endian", [True, False])
+@pytest.mark.parametrize("index_size", [4, 2])
+@pytest.mark.parametrize("vertex_type", sorted(STRIDES))
+def test_parse_model(tmp_path, vertex_type, index_size, little_endian):
+    mesh = parse(tmp_path, build_model(vertex_type, 4, QUAD_FACES, index_size, little_endian))
+
+    assert mesh["vertex_records"].dtype.itemsize == STRIDES[vertex_type]
+    np.testing.assert_array_equal(mesh["vertices"][:, 0], [0, 1, 2, 3])
+    np.testing.assert_array_equal(mesh["faces"], QUAD_FACES)
+
+    # Only the types with the shared fields have UVs
+    has_uvs = STRIDES[vertex_type] >= 52
+    assert len(mesh["uv_map_1"]) == (4 if has_uvs else 0)
+    assert len(mesh["bone_weights"]) == (4 if vertex_type == 7 else 0)
+
+def test_16_bit_faces_that_also_fit_as_32_bit(tmp_path):
+    # 4 vertices of 72 bytes plus 2 faces of 16 bit indices also works out as 4 vertices of 69 bytes plus 2 faces of 32 bit indices.
+    # Both sizes add up, but only the 16 bit reading points at real vertices.
+    mesh = parse(tmp_path, build_model(4, 4, QUAD_FACES, 2, stride=72))
+    assert mesh["vertex_records"].dtype.itemsize == 72
+    np.testing.assert_array_equal(mesh["faces"], QUAD_FACES)
+
+def test_empty_model(tmp_path):
+    mesh = parse(tmp_path, build_model(3, 0, np.zeros((0, 3)), 4))
+    assert len(mesh["vertices"]) == 0
+    assert len(mesh["faces"]) == 0
+
+def test_truncated_model(tmp_path):
+    with pytest.raises(ValueError):
+        parse(tmp_path, build_model(3, 4, QUAD_FACES, 4)[:-8])
+
+def test_wrong_stride_for_documented_type(tmp_path):
+    with pytest.raises(ValueError):
+        parse(tmp_path, build_model(3, 4, QUAD_FACES, 4, stride=56))
+
+def test_faces_out_of_range(tmp_path):
+    with pytest.raises(ValueError, match="Faces reference vertex"):
+        parse(tmp_path, build_model(3, 4, QUAD_FACES + 4, 4))
+
+def test_small_undocumented_layout():
+    layout = get_vertex_layout(5, True, 12)
+    assert layout.names == ("position",)
+    with pytest.raises(ValueError):
+        get_vertex_layout(5, True, 8)
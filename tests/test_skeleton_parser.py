@@ -0,0 +1,57 @@
+# ------------------------------------------------
+#   SKELETON PARSER TESTS
+#       Builds small synthetic skeletons and checks
+#       they parse back the way they were written
+# ------------------------------------------------
+
+import struct
+
+import numpy as np
+import pytest
+
+from io_scene_forge.skeleton_parser import ForgeSkeleton
+
+# Build the bytes of a synthetic skeleton file.
+def build_skeleton(names: list[str], parents: list[int], ids: list[int], little_endian: bool = True) -> bytes:
+    """Build a skeleton file with identity bone matrices, moved along X by each bone's index."""
+    order = "<" if little_endian else ">"
+    data = b"FORGESKL" + struct.pack(order + "3I", int(little_endian), 1, len(names))
+
+    for (index, (parent, bone_id)) in enumerate(zip(parents, ids)):
+        matrix = np.eye(4, dtype=np.float32)
+        matrix[3, 0] = index
+        data += struct.pack(order + "iI", parent, bone_id) + matrix.astype(order + "f4").tobytes()
+
+    for name in names:
+        data += struct.pack(order + "I", len(name)) + name.encode()
+    return data
+
+# Write a synthetic skeleton and parse it back.
+def parse(tmp_path, data: bytes) -> ForgeSkeleton:
+    """Write `data` to a skeleton file and parse it."""
+    skeleton_path = tmp_path / "test.skel_pc"
+    skeleton_path.write_bytes(data)
+    return ForgeSkeleton(str(skeleton_path))
+
+# -------------------------------------------------------------------------------------------------------------------------------------------------
+
+@pytest.mark.parametrize("little_endian", [True, False])
+def test_parse_skeleton(tmp_path, little_endian):
+    skeleton = parse(tmp_path, build_skeleton(["root", "spine", "head"], [-1, 0, 1], [0, 5, 0x7FFFFFFF], little_endian))
+
+    assert skeleton.bone_names == ["root", "spine", "head"]
+    np.testing.assert_array_equal(skeleton.bone_parents, [-1, 0, 1])
+    np.testing.assert_array_equal(skeleton.bone_ids, [0, 5, 0x7FFFFFFF])
+    np.testing.assert_array_equal(skeleton.bone_matrices[:, 3, 0], [0, 1, 2])
+
+def test_bone_id_out_of_range(tmp_path):
+    with pytest.raises(ValueError, match="bone ID"):
+        parse(tmp_path, build_skeleton(["root", "spine"], [-1, 0], [0, 0x80000000]))
+
+def test_missing_parent(tmp_path):
+    with pytest.raises(ValueError, match="parent"):
+        parse(tmp_path, build_skeleton(["root", "spine"], [-1, 2], [0, 1]))
+
+def test_truncated_bone_table(tmp_path):
+    with pytest.raises(ValueError):
+        parse(tmp_path, build_skeleton(["root", "spine"], [-1, 0], [0, 1])[:40])
@@ -0,0 +1,77 @@
+# ------------------------------------------------
+#   TEXTURE PARSER TESTS
+#       Decodes hand-built compressed blocks and
+#       checks the PS4 block untiling
+# ------------------------------------------------
+
+import struct
+
+import numpy as np
+
+from io_scene_forge.texture_parser import decode_bc1_blocks, decode_bc3_blocks, decode_bc5_blocks, untile_ps4_blocks
+
+# Build a BC1 style color block.
+def color_block(c0: int, c1: int, selectors: list[int]) -> bytes:
+    """Pack two RGB565 endpoints and 16 two bit selectors into an 8 byte color block."""
+    bits = sum(selector << (texel * 2) for (texel, selector) in enumerate(selectors))
+    return struct.pack("<HHI", c0, c1, bits)
+
+# Build a BC4 style channel block.
+def channel_block(a0: int, a1: int, selectors: list[int]) -> bytes:
+    """Pack two 8 bit endpoints and 16 three bit selectors into an 8 byte channel block."""
+    bits = sum(selector << (texel * 3) for (texel, selector) in enumerate(selectors))
+    return bytes([a0, a1]) + bits.to_bytes(6, "little")
+
+# Turn block bytes into the array the decoders take.
+def as_blocks(*blocks: bytes) -> np.ndarray:
+    """Stack block bytes into a `(blocks, block size)` array of bytes."""
+    return np.frombuffer(b"".join(blocks), dtype=np.uint8).reshape(len(blocks), -1)
+
+RED = 0xF800
+BLUE = 0x001F
+
+# -------------------------------------------------------------------------------------------------------------------------------------------------
+
+def test_bc1_four_colors():
+    texels = decode_bc1_blocks(as_blocks(color_block(RED, BLUE, [0, 1, 2, 3] * 4)))
+    np.testing.assert_array_equal(texels[0, :4], [[255, 0, 0, 255], [0, 0, 255, 255], [170, 0, 85, 255], [85, 0, 170, 255]])
+
+def test_bc1_three_colors_and_transparent():
+    # c0 <= c1 switches BC1 to three colors plus transparent black
+    texels = decode_bc1_blocks(as_blocks(color_block(BLUE, RED, [0, 1, 2, 3] * 4)))
+    np.testing.assert_array_equal(texels[0, :4], [[0, 0, 255, 255], [255, 0, 0, 255], [127, 0, 127, 255], [0, 0, 0, 0]])
+
+def test_bc3_alpha():
+    # a0 > a1 gives eight alpha values; BC3 colors never use the transparent mode
+    alpha = channel_block(255, 0, [0, 1, 2, 7] * 4)
+    texels = decode_bc3_blocks(as_blocks(alpha + color_block(BLUE, RED, [3] * 16)))
+    np.testing.assert_array_equal(texels[0, :4, 3], [255, 0, 218, 36])
+    np.testing.assert_array_equal(texels[0, 0, :3], [170, 0, 85])
+
+def test_bc3_six_alpha_mode():
+    # a0 <= a1 gives six alpha values plus 0 and 255
+    alpha = channel_block(0, 255, [2, 6, 7] + [0] * 13)
+    texels = decode_bc3_blocks(as_blocks(alpha + color_block(RED, BLUE, [0] * 16)))
+    np.testing.assert_array_equal(texels[0, :3, 3], [51, 0, 255])
+
+def test_bc5_normal():
+    # A flat normal (X and Y at the middle of the range) points straight up Z
+    flat = channel_block(128, 128, [0] * 16)
+    texels = decode_bc5_blocks(as_blocks(flat + flat))
+    np.testing.assert_array_equal(texels[0, 0], [128, 128, 255, 255])
+
+    # Fully along X leaves nothing for Z
+    red = channel_block(255, 0, [0] * 16)
+    texels = decode_bc5_blocks(as_blocks(red + flat))
+    np.testing.assert_array_equal(texels[0, 0], [255, 128, 128, 255])
+
+def test_untile_ps4_blocks():
+    # Two 8x8 tiles side by side, each block holding its storage index
+    blocks = np.arange(128, dtype=np.uint8).reshape(-1, 1)
+    grid = untile_ps4_blocks(blocks, 16, 8).reshape(8, 16)
+
+    # Blocks are stored in Morton order inside each tile
+    np.testing.assert_array_equal(grid[0, :8], [0, 1, 4, 5, 16, 17, 20, 21])
+    np.testing.assert_array_equal(grid[1, :8], [2, 3, 6, 7, 18, 19, 22, 23])
+    np.testing.assert_array_equal(grid[7, 7], 63)
+    np.testing.assert_array_equal(grid[0, 8:], grid[0, :8] + 64)
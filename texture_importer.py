@@ -0,0 +1,63 @@
+# ------------------------------------------------
+#   TEXTURE IMPORTER
+#       Takes the parsed texture data and
+#       loads it into Blender as an image
+# ------------------------------------------------
+"""
+Takes the parsed texture data and loads it into Blender as an image.
+"""
+
+import os
+import bpy
+import hashlib
+import numpy as np
+
+from .texture_parser import ForgeTexture, is_ps4_texture
+from .bpy_util_funcs import *
+
+# Import the texture!
+def import_texture(context: bpy.types.Context, file_path: str, texture_format: str = "AUTO", pack_image: bool = True):
+    """Import a texture and load it into Blender as an image. Packing the image into the .blend file can be skipped to speed up big batches."""
+
+    print(f"\nIMPORTING TEXTURE: {file_path}...\n")
+
+    # Make sure the file exists!
+    if not os.path.exists(file_path):
+        print(f"Cannot import texture; file not found at: {file_path}")
+        return {'FINISHED'}
+
+    data = open(file_path, "rb").read()
+
+    # Same bytes (and format, and platform since PS4 blocks get untiled) as a texture we already made? Just hand that one back.
+    # The key lives on the image itself, so it goes away with the image and doesn't carry over to other .blend files.
+    content_key = f"{hashlib.blake2b(data, digest_size=16).hexdigest()}:{texture_format}:{'ps4' if is_ps4_texture(file_path) else 'pc'}"
+    cached_image = next((image for image in bpy.data.images if image.get("forge_content_key") == content_key), None)
+    if cached_image is not None:
+        print(f"Texture already imported as '{cached_image.name}', skipping decode.")
+        return {'FINISHED'}
+
+    texture = ForgeTexture(file_path, data, texture_format)
+    pixels = texture.decode()
+
+    # Extract the filename for image naming
+    image_name = os.path.splitext(os.path.basename(file_path))[0]
+    print(f"\nBuilding Image: {image_name}")
+
+    # Blender wants floats from the bottom row up
+    pixels = np.ascontiguousarray(pixels[::-1], dtype=np.float32).ravel()
+    pixels /= 255
+
+    image = bpy.data.images.new(image_name, texture.width, texture.height, alpha=True)
+    image.pixels.foreach_set(pixels)
+
+    # BC5 textures are normal maps, so they hold data rather than colors
+    if texture.texture_format == "BC5":
+        image.colorspace_settings.name = 'Non-Color'
+
+    if pack_image:
+        image.pack()
+
+    image["forge_content_key"] = content_key
+
+    print("\nTEXTURE IMPORT COMPLETE!")
+    return {'FINISHED'}
@@ -0,0 +1,307 @@
+import numpy as np
+
+from .readers import Reader
+from .data_util_funcs import *
+
+# -------------------------------------------------------
+# BLOCK COMPRESSION FORMATS
+# -------------------------------------------------------
+
+# Bytes taken up by one 4x4 block in each of the block compressed formats
+BLOCK_SIZES = {
+    "BC1": 8,
+    "BC3": 16,
+    "BC5": 16,
+}
+
+# Formats tried (in order) when working out the format from the size of the top mipmap. BC5 is the same size as BC3 so it has to be picked by hand.
+AUTO_TEXTURE_FORMATS = ("BC1", "BC3", "RGBA8")
+
+# PS4 textures are told apart by their extension.
+def is_ps4_texture(file_path: str) -> bool:
+    """Return `True` if the texture file is a PS4 texture (`.bmp_ps4` / `.png_ps4`), whose blocks are stored tiled."""
+    return file_path.lower().endswith("_ps4")
+
+class ForgeTexture():
+    """Forge texture format class. Used for Rock Band 4 and VR textures (.bmp_pc / .png_pc / .bmp_ps4 / .png_ps4)"""
+    # Class constructor.
+    def __init__(self, file_path: str, data: bytes | None = None, texture_format: str = "AUTO"):
+        """Forge texture format class. Used for Rock Band 4 and VR textures (.bmp_pc / .png_pc / .bmp_ps4 / .png_ps4)"""
+
+        # Class init stuff
+        super().__init__()
+
+        # -------------------------------
+        # -- CLASS MEMBERS --------------
+        # -------------------------------
+
+        # -- TEXTURE FILE
+        self.texture_file: str = file_path
+        """The path to the texture file."""
+
+        # -- RAW FILE DATA
+        self.file_data: bytes = data if data is not None else open(file_path, "rb").read()
+        """The bytes of the texture file. Can be handed in by the caller if it already read them."""
+
+        # -- IS PS4 TEXTURE
+        self.is_ps4: bool = is_ps4_texture(file_path)
+        """PS4 textures store their blocks tiled and need to be untiled before decoding."""
+
+        # -- TEXTURE FORMAT
+        self.texture_format: str = texture_format
+        """The pixel format of the texture. (`AUTO` works it out from the size of the top mipmap)"""
+
+        # -- DIMENSIONS
+        self.width: int = 0
+        """Width of the top mipmap."""
+        self.height: int = 0
+        """Height of the top mipmap."""
+
+        # -- MIPMAP DATA
+        self.mipmaps: list[tuple[int, int, int, memoryview]] = []
+        """Every mipmap in the file as `(width, height, flags, data)`."""
+
+        # -------------------------------
+        # -- PARSE THE DATA -------------
+        # -------------------------------
+
+        # Parse our texture file here!
+        self.parse_texture_file()
+
+    # Main texture parser!
+    def parse_texture_file(self):
+        """ Parse the texture file itself! """
+        print(f"Parsing texture data...\n")
+
+        # -------------------------------
+        # Initialize the reader
+        reader = Reader(self.file_data)
+        # -------------------------------
+
+        # -------
+        # HEADER
+        # -------
+
+        version = reader.int32()
+        if version == 4:
+            header_size = 0x1C
+        elif version == 6:
+            header_size = 0x1F
+        else:
+            raise ValueError(f"Unsupported texture version {version}!")
+        print(f"Texture Version: {version}")
+
+        header_data = [reader.uint32() for (_) in range(header_size)]
+
+        mipmapCount = reader.uint32()
+        print(f"Mipmap Count: {mipmapCount}")
+
+        # --------
+        # MIPMAPS
+        # --------
+
+        for (_) in (range(mipmapCount)):
+            width = reader.int32()
+            height = reader.int32()
+            flags = reader.int32()
+            size = reader.int32()
+
+            if reader.tell() + size > reader.length:
+                raise ValueError("Mipmap data runs past the end of the texture file!")
+
+            self.mipmaps.append((width, height, flags, reader.read_bytes(size)))
+
+        if not self.mipmaps:
+            raise ValueError("Texture has no mipmaps to decode!")
+
+        self.width, self.height = self.mipmaps[0][0], self.mipmaps[0][1]
+        print(f"Dimensions: {self.width}x{self.height}")
+
+        # Work out the format from how big the top mipmap is, if it wasn't forced
+        if self.texture_format == "AUTO":
+            top_size = len(self.mipmaps[0][3])
+            self.texture_format = next((fmt for fmt in AUTO_TEXTURE_FORMATS if self.expected_size(fmt) == top_size), None)
+            if self.texture_format is None:
+                raise ValueError(f"Unable to determine the texture's pixel format from its size! ({top_size} bytes)")
+        print(f"Texture Format: {self.texture_format}")
+
+        print(f"\nTEXTURE PARSING COMPLETE!")
+
+    # Size of the top mipmap in a given format.
+    def expected_size(self, texture_format: str) -> int:
+        """ How many bytes the top mipmap would take up if it was stored in the given format. """
+        if texture_format == "RGBA8":
+            return self.width * self.height * 4
+
+        blocks_wide = align_to_blocks(self.width)
+        blocks_high = align_to_blocks(self.height)
+        if self.is_ps4:
+            blocks_wide = align_to_tiles(blocks_wide)
+            blocks_high = align_to_tiles(blocks_high)
+        return blocks_wide * blocks_high * BLOCK_SIZES[texture_format]
+
+    # Decode the top mipmap.
+    def decode(self) -> np.ndarray:
+        """ Decode the top mipmap into a `(height, width, 4)` array of 8 bit RGBA pixels, top row first. """
+        width, height, _, data = self.mipmaps[0]
+
+        if self.texture_format == "RGBA8":
+            return np.frombuffer(data, dtype=np.uint8, count=width * height * 4).reshape(height, width, 4)
+
+        block_size = BLOCK_SIZES[self.texture_format]
+        blocks_wide = align_to_blocks(width)
+        blocks_high = align_to_blocks(height)
+
+        if self.is_ps4:
+            # PS4 tiles pad the block grid out to whole 8x8 tiles
+            tiled_wide = align_to_tiles(blocks_wide)
+            tiled_high = align_to_tiles(blocks_high)
+            blocks = np.frombuffer(data, dtype=np.uint8, count=tiled_wide * tiled_high * block_size).reshape(-1, block_size)
+            blocks = untile_ps4_blocks(blocks, tiled_wide, tiled_high)
+            blocks = blocks.reshape(tiled_high, tiled_wide, block_size)[:blocks_high, :blocks_wide].reshape(-1, block_size)
+        else:
+            blocks = np.frombuffer(data, dtype=np.uint8, count=blocks_wide * blocks_high * block_size).reshape(-1, block_size)
+
+        if self.texture_format == "BC1":
+            texels = decode_bc1_blocks(blocks)
+        elif self.texture_format == "BC3":
+            texels = decode_bc3_blocks(blocks)
+        else:
+            texels = decode_bc5_blocks(blocks)
+
+        # (blocks, 4, 4, 4) -> (height, width, 4)
+        pixels = texels.reshape(blocks_high, blocks_wide, 4, 4, 4).transpose(0, 2, 1, 3, 4).reshape(blocks_high * 4, blocks_wide * 4, 4)
+        return pixels[:height, :width]
+
+# -------------------------------------------------------------------------------------------------------------------------------------------------
+
+# -----------------
+# BLOCK DECODING
+# -----------------
+
+# Number of 4x4 blocks needed to cover a given number of pixels.
+def align_to_blocks(pixels: int) -> int:
+    """Return the number of 4x4 blocks needed to cover `pixels` pixels."""
+    return max((pixels + 3) // 4, 1)
+
+# Round a block count up to whole PS4 tiles.
+def align_to_tiles(blocks: int) -> int:
+    """Round a number of blocks up to a multiple of 8, the width/height of a PS4 block tile."""
+    return ((blocks + 7) // 8) * 8
+
+# Morton (Z-order) positions of the 64 blocks in a PS4 8x8 tile.
+def ps4_tile_order() -> tuple[np.ndarray, np.ndarray]:
+    """Return the X and Y position of each of the 64 blocks inside a PS4 8x8 block tile, in storage order."""
+    order = np.arange(64)
+    x = (order & 1) | ((order >> 1) & 2) | ((order >> 2) & 4)
+    y = ((order >> 1) & 1) | ((order >> 2) & 2) | ((order >> 3) & 4)
+    return x, y
+
+# Untile a whole block grid at once.
+def untile_ps4_blocks(blocks: np.ndarray, blocks_wide: int, blocks_high: int) -> np.ndarray:
+    """Reorder PS4 tiled blocks into plain row-major order. `blocks_wide` and `blocks_high` must be multiples of 8."""
+    tile_x, tile_y = ps4_tile_order()
+    tiles_wide = blocks_wide // 8
+    tiles_high = blocks_high // 8
+
+    # Where each stored block ends up in the untiled grid
+    tile_index = np.arange(tiles_wide * tiles_high)
+    dest_x = ((tile_index % tiles_wide) * 8)[:, None] + tile_x[None, :]
+    dest_y = ((tile_index // tiles_wide) * 8)[:, None] + tile_y[None, :]
+    dest = (dest_y * blocks_wide + dest_x).ravel()
+
+    untiled = np.empty_like(blocks)
+    untiled[dest] = blocks
+    return untiled
+
+# Expand 16 bit 565 colors to 8 bit RGB.
+def unpack_rgb565(colors: np.ndarray) -> np.ndarray:
+    """Expand an array of 16 bit RGB565 colors to a `(..., 3)` array of 8 bit RGB."""
+    colors = colors.astype(np.uint32)
+    r = (colors >> 11) & 0x1F
+    g = (colors >> 5) & 0x3F
+    b = colors & 0x1F
+    return np.stack(((r << 3) | (r >> 2), (g << 2) | (g >> 4), (b << 3) | (b >> 2)), axis=-1)
+
+# Decode the color half of BC1/BC3 blocks.
+def decode_color_blocks(blocks: np.ndarray, allow_alpha: bool = True) -> np.ndarray:
+    """Decode 8 byte BC1 color blocks into a `(blocks, 16, 4)` array of RGBA texels."""
+    c0 = blocks[:, 0].astype(np.uint16) | (blocks[:, 1].astype(np.uint16) << 8)
+    c1 = blocks[:, 2].astype(np.uint16) | (blocks[:, 3].astype(np.uint16) << 8)
+    rgb0 = unpack_rgb565(c0)
+    rgb1 = unpack_rgb565(c1)
+
+    # Four color mode by default, three colors plus transparent black when c0 <= c1 (BC1 only)
+    palette = np.empty((len(blocks), 4, 4), dtype=np.uint32)
+    palette[:, 0, :3] = rgb0
+    palette[:, 1, :3] = rgb1
+    palette[:, 2, :3] = (2 * rgb0 + rgb1) // 3
+    palette[:, 3, :3] = (rgb0 + 2 * rgb1) // 3
+    palette[:, :, 3] = 255
+
+    if allow_alpha:
+        three_color = c0 <= c1
+        palette[three_color, 2, :3] = (rgb0[three_color] + rgb1[three_color]) // 2
+        palette[three_color, 3] = 0
+
+    indices = blocks[:, 4:8].copy().view("<u4").ravel()
+    selectors = (indices[:, None] >> (np.arange(16, dtype=np.uint32) * 2)) & 3
+
+    return np.take_along_axis(palette, selectors[:, :, None].astype(np.intp), axis=1).astype(np.uint8)
+
+# Decode BC4 style single channel blocks. (BC3 alpha and both BC5 channels)
+def decode_channel_blocks(blocks: np.ndarray) -> np.ndarray:
+    """Decode 8 byte BC4 channel blocks into a `(blocks, 16)` array of 8 bit values."""
+    a0 = blocks[:, 0].astype(np.int32)
+    a1 = blocks[:, 1].astype(np.int32)
+
+    # Eight value mode when a0 > a1, otherwise six values plus 0 and 255
+    steps = np.arange(1, 7, dtype=np.int32)
+    eight = ((7 - steps)[None, :] * a0[:, None] + steps[None, :] * a1[:, None]) // 7
+    six = ((5 - steps[:4])[None, :] * a0[:, None] + steps[None, :4] * a1[:, None]) // 5
+
+    palette = np.empty((len(blocks), 8), dtype=np.int32)
+    palette[:, 0] = a0
+    palette[:, 1] = a1
+    eight_mode = a0 > a1
+    palette[eight_mode, 2:] = eight[eight_mode]
+    palette[~eight_mode, 2:6] = six[~eight_mode]
+    palette[~eight_mode, 6] = 0
+    palette[~eight_mode, 7] = 255
+
+    # 48 bits of 3 bit selectors
+    bits = np.zeros(len(blocks), dtype=np.uint64)
+    for byte in range(6):
+        bits |= blocks[:, 2 + byte].astype(np.uint64) << np.uint64(byte * 8)
+    selectors = (bits[:, None] >> (np.arange(16, dtype=np.uint64) * np.uint64(3))) & np.uint64(7)
+
+    return np.take_along_axis(palette, selectors.astype(np.intp), axis=1).astype(np.uint8)
+
+# BC1 (DXT1)
+def decode_bc1_blocks(blocks: np.ndarray) -> np.ndarray:
+    """Decode BC1 blocks into a `(blocks, 16, 4)` array of RGBA texels."""
+    return decode_color_blocks(blocks)
+
+# BC3 (DXT5)
+def decode_bc3_blocks(blocks: np.ndarray) -> np.ndarray:
+    """Decode BC3 blocks into a `(blocks, 16, 4)` array of RGBA texels."""
+    texels = decode_color_blocks(blocks[:, 8:], allow_alpha=False)
+    texels[:, :, 3] = decode_channel_blocks(blocks[:, :8])
+    return texels
+
+# BC5 (ATI2 / 3Dc), used for normal maps.
+def decode_bc5_blocks(blocks: np.ndarray) -> np.ndarray:
+    """Decode BC5 blocks into a `(blocks, 16, 4)` array of RGBA texels, rebuilding the normal's Z in the blue channel."""
+    red = decode_channel_blocks(blocks[:, :8])
+    green = decode_channel_blocks(blocks[:, 8:])
+
+    x = (red.astype(np.float32) / 127.5) - 1
+    y = (green.astype(np.float32) / 127.5) - 1
+    z = np.sqrt(np.clip(1 - (x * x) - (y * y), 0, 1))
+
+    texels = np.empty((len(blocks), 16, 4), dtype=np.uint8)
+    texels[:, :, 0] = red
+    texels[:, :, 1] = green
+    texels[:, :, 2] = np.round((z + 1) * 127.5).astype(np.uint8)
+    texels[:, :, 3] = 255
+    return texels